@@ -32,7 +32,8 @@ if __name__ == "__main__":
         input_file_path_list=es_files,
         function=es_func,
         destination='/Users/jonny/Documents/eth/bachelor_thesis/bachelors-thesis/datasets/nela/content_only',
-        output_prefix='es_'
+        output_prefix='es_',
+        n_workers=None # one process per core – the nela files are independent, and each one is a single json array es can't split
     )
     
     proc.process_files()
\ No newline at end of file
@@ -4,10 +4,12 @@ from utils.filefinder import FileFinder
 from pathlib import Path
 import re
 import psycopg
-import json
+from utils.jsonio import orjson # orjson, or the stdlib fallback with the same calls
+import ijson
 import xxhash
 import logging
 import time
+from itertools import islice
 
 logging.basicConfig(level=logging.DEBUG, format="%(asctime)s %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -17,6 +19,7 @@ USER = ""
 PASSWORD = ""
 
 STOP_SENTINEL = ["i", "love", "blueberry", "waffles"]
+TRAILING_DIGITS_PATTERN = re.compile(r'(\d+)$')
 
 def extract_file_idx(file_path: Path, prefix: str, suffix: str, extension: str) -> int:
     filename = file_path.name
@@ -57,9 +60,6 @@ if __name__ == "__main__":
 
         start_time = time.time()
 
-        with open(slc_file, 'r') as infile:
-            sentence_list = json.load(infile)
-
         file_idx = extract_file_idx(Path(slc_file), prefix="slc", suffix="", extension=".json")
 
         with conn.cursor() as cur:
@@ -78,56 +78,59 @@ if __name__ == "__main__":
             for hash_str, line_num, sent_num, run_length in runs
         }
 
-        output_list = []
-        line_num = 0
-        sent_num = 0
-        i = 0
-        n = len(sentence_list)
-
-        while i < n:
-            sentence = sentence_list[i]
-
-            if sentence == STOP_SENTINEL:
-                line_num += 1
-                sent_num = 0
-                i += 1
-                output_list.append(sentence) # for glove (will be filtered in create_ijson_gen anyway)
-                continue  # do not include in output
-
-            key = (line_num, sent_num)
-            if key in run_map:
-                expected_hash, run_length = run_map[key]
-
-                # extract run slice and verify hash
-                if i + run_length > n:
-                    logger.error(f"Run at {key} exceeds sentence list bounds")
-                    break
-
-                run_slice = sentence_list[i : i + run_length]
-                all_match = all(hash_sentence(s) == expected_hash for s in run_slice)
-
-                if not all_match:
-                    logger.error(f"Hash mismatch in run at {key} with length {run_length}")
-                else:
-                    logger.debug(f"Removed repeated run at {key} (length {run_length})")
-
-                # skip entire run
-                i += run_length
-                sent_num += run_length
-            else:
-                output_list.append(sentence)
-                i += 1
-                sent_num += 1
-
-        # save cleaned file
-        match = re.search(r'(\d+)$', Path(slc_file).stem)
+        # cleaned file
+        match = TRAILING_DIGITS_PATTERN.search(Path(slc_file).stem)
         suffix = match.group(1) if match else Path(slc_file).stem
 
         output_path = Path(f"") / f"w2v{suffix}.json"
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w') as outfile:
-            json.dump(output_list, outfile, ensure_ascii=False)
+        line_num = 0
+        sent_num = 0
+
+        # stream the sentence list in and the kept sentences out, instead of loading the whole file and building a second list
+        # (a json list of the kept sentences like json.dump wrote, only without spaces inside the sentence lists)
+        with open(slc_file, 'rb') as infile, open(output_path, 'wb') as outfile:
+            sentences = ijson.items(infile, 'item', buf_size=1 << 20) # 1MB reads instead of ijson's default 64KB
+            separator = b""
+            outfile.write(b"[")
+            write = outfile.write # bound once for the per-sentence writes
+            dumps = orjson.dumps
+
+            for sentence in sentences:
+
+                if sentence == STOP_SENTINEL:
+                    line_num += 1
+                    sent_num = 0
+                    write(separator + dumps(sentence)) # for glove (will be filtered in create_ijson_gen anyway)
+                    separator = b", "
+                    continue  # do not include in output
+
+                key = (line_num, sent_num)
+                if key in run_map:
+                    expected_hash, run_length = run_map[key]
+
+                    # extract run slice (this sentence and the ones after it) and verify hash
+                    run_slice = [sentence] + list(islice(sentences, run_length - 1))
+                    if len(run_slice) < run_length:
+                        logger.error(f"Run at {key} exceeds sentence list bounds")
+                        break
+
+                    all_match = all(hash_sentence(s) == expected_hash for s in run_slice)
+
+                    if not all_match:
+                        logger.error(f"Hash mismatch in run at {key} with length {run_length}")
+                    else:
+                        logger.debug(f"Removed repeated run at {key} (length {run_length})")
+
+                    # skip entire run
+                    sent_num += run_length
+                else:
+                    write(separator + dumps(sentence))
+                    separator = b", "
+                    sent_num += 1
+
+            outfile.write(b"]")
 
         loop_time = time.time() - start_time
         total_time += loop_time
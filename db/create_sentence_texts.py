@@ -1,7 +1,7 @@
 # create_sentence_texts.py
 
 import psycopg
-import json
+from utils.jsonio import orjson # orjson, or the stdlib fallback with the same calls
 import xxhash
 from pathlib import Path
 from psycopg import Connection
@@ -15,6 +15,8 @@ DATA_DIR = ""
 USER = ""
 PASSWORD = ""
 
+STOP_SENTINEL = ["i", "love", "blueberry", "waffles"] # built once, not for every item compared against it
+
 def create_sentence_texts_table(conn: Connection):
     with conn.cursor() as cur:
         # this automatically creates an index on hash
@@ -49,8 +51,8 @@ def populate_sentence_texts(conn: Connection, batch_size=1000, prefix=""):
         logger.info(f"Processing file {prefix}slc{file_num}.json with {len(entries)} hashes")
         try:
             file_path = Path(DATA_DIR) / f"{prefix}slc{file_num}.json"
-            with file_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            with file_path.open("rb") as f:
+                data = orjson.loads(f.read()) # parses the raw bytes, no separate utf-8 decode
         except FileNotFoundError:
             logger.warning(f"File {prefix}slc{file_num}.json not found, skipping")
             continue
@@ -59,7 +61,7 @@ def populate_sentence_texts(conn: Connection, batch_size=1000, prefix=""):
         line_start_map = {0: 0}
         current_line_num = 0
         for idx, item in enumerate(data):
-            if item == ["i", "love", "blueberry", "waffles"]:
+            if item == STOP_SENTINEL:
                 current_line_num += 1
                 line_start_map[current_line_num] = idx + 1
 
@@ -80,7 +82,7 @@ def populate_sentence_texts(conn: Connection, batch_size=1000, prefix=""):
                 sentence_tokens = data[actual_index]
                 
                 # ensure the retrieved item is a list (tokens) and not a stop token itself
-                if not isinstance(sentence_tokens, list) or sentence_tokens == ["i", "love", "blueberry", "waffles"]:
+                if not isinstance(sentence_tokens, list) or sentence_tokens == STOP_SENTINEL:
                     logger.warning(f"Retrieved item at slc{file_num} line {line_num} sent {sent_num} is not a valid sentence: {sentence_tokens}")
                     continue
 
@@ -4,7 +4,7 @@ from utils.filefinder import FileFinder
 from pathlib import Path
 import logging
 import re
-import json
+from utils.jsonio import orjson # orjson, or the stdlib fallback with the same calls
 import xxhash
 import psycopg
 from psycopg import Connection
@@ -50,6 +50,8 @@ def populate_db(
     try:
         with database_conn.cursor() as cursor:
             buffer = []
+            append = buffer.append # bound once, the buffer is cleared in place between batches
+            xxh64 = xxhash.xxh64
 
             for file_path in input_file_paths:
                 file_path = Path(file_path)
@@ -65,8 +67,8 @@ def populate_db(
                 offset = 0
 
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    with open(file_path, 'rb') as f:
+                        data = orjson.loads(f.read()) # parses the raw bytes, no separate utf-8 decode
 
                     if not isinstance(data, list) or not all(isinstance(sentence, list) for sentence in data):
                         raise ValueError("File must contain a list of lists (tokenized sentences)")
@@ -81,10 +83,12 @@ def populate_db(
                         if not sentence: # kinda redundant but better to double check
                             continue
 
-                        sentence_hash = hash_sentence(sentence)
-                        glove_output_length = len(" ".join(sentence)) + 1
+                        # joined once for both the hash (same as hash_sentence) and the glove line length
+                        sentence_str = " ".join(sentence)
+                        sentence_hash = xxh64(sentence_str).hexdigest()
+                        glove_output_length = len(sentence_str) + 1
 
-                        buffer.append((
+                        append((
                             sentence_hash,
                             file_idx,
                             line_idx,
@@ -106,7 +110,7 @@ def populate_db(
                                 database_conn.rollback()
                                 buffer.clear()
 
-                except (json.JSONDecodeError, IOError, ValueError) as e:
+                except (orjson.JSONDecodeError, IOError, ValueError) as e:
                     logger.error(f"Error processing {file_path}: {e}")
                     continue
 
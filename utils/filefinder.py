@@ -1,6 +1,11 @@
 from pathlib import Path
+import os
+import re
+import fnmatch
 import logging
-from typing import List, Optional, Union
+from queue import Queue, Full
+from threading import Thread, Event
+from typing import List, Optional, Union, Iterator
 
 # set up logging
 logging.basicConfig(
@@ -32,6 +37,7 @@ class FileFinder:
         self.suffix = suffix
         self.file_list = file_list 
         self.recursive = recursive
+        self._compile_pattern()
 
         # validate directory 
         if not self.directory.exists():
@@ -41,25 +47,18 @@ class FileFinder:
             logger.error(f"Path is not a directory: {self.directory}")
             raise NotADirectoryError(f"Path is not a directory: {self.directory}")
 
-    def find_files(self) -> List[Path]:
+    def find_files(self) -> List[str]:
 
         # finds files matching the specified criteria
-        # returns a list of path objects for files that match the criteria
+        # returns a list of path strings for files that match the criteria (same for recursive and non-recursive searches)
         
         root_path = self.directory
         matching_files = []
 
-        pattern = f"{self.prefix}*{self.suffix}"
-        if self.file_extension:
-            pattern += f"{self.file_extension}"
-
-        logger.info(f"Searching for files with pattern '{pattern}' in {root_path}")
+        logger.info(f"Searching for files with pattern '{self.pattern}' in {root_path}")
 
         try: 
-            if self.recursive:
-                matching_files = [file_path for file_path in root_path.rglob(pattern) if file_path.is_file()]
-            else:
-                matching_files = [str(file_path) for file_path in root_path.glob(pattern) if file_path.is_file()]
+            matching_files = list(self.iter_files())
         
             self.file_list = matching_files 
             logger.info(f"Found {len(matching_files)} files matching the criteria")
@@ -69,16 +68,102 @@ class FileFinder:
         except Exception as e:
             logger.error(f"Error finding files: {e}")
             raise
+
+    def iter_files(self, prefetch: bool = False) -> Iterator[str]:
+
+        # lazy version of find_files: yields matching path strings while the directory is still being walked
+        # (doesn't touch self.file_list, callers that want the list use find_files)
+        # prefetch walks in a background thread, so listing (slow on network filesystems) overlaps with whatever the caller does per file
+
+        # scandir instead of glob/rglob: DirEntry answers is_file/is_dir from the readdir data, without a stat and a Path per entry
+        walker = self._walk(str(self.directory), self._name_match)
+        return self._prefetch(walker) if prefetch else walker
+
+    @staticmethod
+    def _prefetch(iterator: Iterator[str], maxsize: int = 1024) -> Iterator[str]:
+
+        # drains iterator in a daemon thread into a bounded queue, errors are re-raised on the consumer side
+        # scandir releases the gil while it waits on the filesystem
+        # if the consumer stops early (break, exception, garbage collection), the thread notices within a put timeout,
+        # closes the walk (and with it its open scandir handles) and exits instead of blocking on a full queue forever
+
+        queue = Queue(maxsize=maxsize)
+        done = object()
+        stopped = Event()
+
+        def put(item) -> bool:
+            # blocks while the queue is full, returns False once the consumer is gone
+            while not stopped.is_set():
+                try:
+                    queue.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    pass
+            return False
+
+        def fill() -> None:
+            try:
+                for item in iterator:
+                    if not put(item):
+                        return
+                put(done)
+            except Exception as e:
+                put(e)
+            finally:
+                if hasattr(iterator, 'close'): # generator walks release their scandir handles here
+                    iterator.close()
+
+        Thread(target=fill, daemon=True).start()
+        try:
+            while True:
+                item = queue.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    logger.error(f"Error finding files: {item}")
+                    raise item
+                yield item
+        finally:
+            stopped.set()
     
+    def _compile_pattern(self) -> None:
+
+        # builds the glob pattern from prefix/suffix/extension and compiles it once (redone by the setters)
+        # case-insensitive on windows, like glob there
+
+        self.pattern = f"{self.prefix}*{self.suffix}"
+        if self.file_extension:
+            self.pattern += f"{self.file_extension}"
+        self._name_match = re.compile(fnmatch.translate(self.pattern), re.IGNORECASE if os.name == 'nt' else 0).match
+
+    def _walk(self, directory: str, name_match) -> Iterator[str]:
+
+        # yields the paths of files in directory (and its subdirectories if recursive) whose name matches
+        # symlinked directories aren't descended into, like rglob
+        # subdirectories go on a stack instead of recursing, so deep trees don't stack up generator frames
+
+        stack = [directory]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.recursive:
+                            stack.append(entry.path)
+                    elif name_match(entry.name) and entry.is_file():
+                        yield entry.path
+
     def set_file_extension(self, file_extension) -> None:
         # add some testing to ensure it's a valid file extension
         self.file_extension = file_extension
+        self._compile_pattern()
 
     def set_prefix(self, prefix) -> None:
         self.prefix = prefix
+        self._compile_pattern()
     
     def set_suffix(self, suffix) -> None:
         self.suffix = suffix
+        self._compile_pattern()
 
     def set_directory(self, directory: Union[str, Path]) -> None:
         self.directory = Path(directory) if isinstance(directory, str) else directory
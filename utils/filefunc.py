@@ -1,19 +1,34 @@
 from pathlib import Path
+import os
+import mmap
 import shutil
 import logging
-from typing import List, Optional, Iterator, Any
+from functools import lru_cache
+from itertools import groupby, repeat
+from collections import deque
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Iterator, Any, Tuple
 
 # for SentenceListCreator
 import re
-import json
+from utils.jsonio import orjson # orjson, or the stdlib fallback with the same calls; also used by EntrySimplifier
 import spacy
 from spacy.tokens import Doc
+from spacy.language import Language
+from spacy.attrs import ENT_IOB, ENT_TYPE, NORM, IS_ALPHA, ORTH
 
 # for EntrySimplifier
-from datetime import datetime
+from datetime import date, datetime
+from itertools import chain
+import ijson
 
 # for TextCleaner
 import contractions
+try:
+    import re2 # google-re2: linear-time dfa matching for the bracket scans, same api as re
+except ImportError:
+    re2 = re
 
 # for NewsCleaner
 import xxhash
@@ -25,6 +40,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger("FileFunction")
 
+# ijson picks the fastest backend it can import (yajl2_c if the wheel has the c extension)
+# the pure python fallback is ~10x slower on the nela/sentence list files, so at least say so
+if getattr(ijson, 'backend', 'yajl2_c') != 'yajl2_c':
+    logger.warning(f"ijson is using the {ijson.backend} backend, json streaming will be slow (install ijson with its yajl2_c extension)")
+
+
+def _available_cpus() -> int:
+
+    # cores this process may actually run on – slurm (and taskset/cgroups) restrict the affinity mask,
+    # while os.cpu_count() reports every core of the node
+    # sched_getaffinity is linux-only, other platforms fall back to the plain count
+
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# lines shorter than this go through the contractions (and news tail) cache, longer ones are fixed directly
+_CONTRACTIONS_CACHE_MAX_LEN = 2048
+
+@lru_cache(maxsize=1 << 12)
+def _fix_contractions_cached(text: str) -> str:
+    return contractions.fix(text)
+
+def _fix_contractions(text: str) -> str:
+
+    # contractions.fix is pure python and slow, and short lines (intros, ads, stock phrases) do repeat
+    # a TextCleaner line is usually a whole transcript though, which never repeats exactly –
+    # caching those would only pin hundreds of MB per process, so only short lines are cached
+
+    if len(text) < _CONTRACTIONS_CACHE_MAX_LEN:
+        return _fix_contractions_cached(text)
+    return contractions.fix(text)
+
+
+def _iter_mmap_lines(file) -> Iterator[bytes]:
+
+    # yields the lines of a file opened in binary mode, without their trailing newline
+    # lines are sliced straight out of an mmap of the file, so there's no readline buffering or rstrip copy
+    # a '\r' before the newline (crlf input) is cut off too, like text mode did – left in, it counts as \s for the cleaners' regexes
+
+    if os.fstat(file.fileno()).st_size == 0: # empty files can't be mapped
+        return
+
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = 0
+        end = len(mm)
+        while pos < end:
+            newline = mm.find(b'\n', pos)
+            if newline == -1: # last line without a newline
+                newline = end
+            line_end = newline - 1 if newline > pos and mm[newline - 1] == 13 else newline # 13 == ord('\r')
+            yield mm[pos:line_end]
+            pos = newline + 1
+
+
 class FileFunction:
 
     # base class for file functions mapping input to output files
@@ -69,18 +141,58 @@ class FileFunction:
         # assumes input and output files are valid
 
         logger.info(f"Copying file from {self.input_file_path} to {self.output_file_path}")
-        shutil.copy2(self.input_file_path, self.output_file_path) # default implementation
+
+        # default implementation: copy in kernel space with copy_file_range (linux, python 3.8+), metadata like copy2
+        # anything that can't do that (other os, cross-filesystem on old kernels, ...) falls back to copy2
+        try:
+            with open(self.input_file_path, 'rb') as src, open(self.output_file_path, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining) # may copy less than asked
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(self.input_file_path, self.output_file_path)
+        except (AttributeError, OSError):
+            shutil.copy2(self.input_file_path, self.output_file_path)
 
 
     def check_extensions(self):
 
         # check if input file paths match the extensions the class is expecting
+        # (name.endswith instead of Path.suffix, which re-splits the name on every call – this runs once per file)
 
-        input_match = self.input_extension is None or self.input_file_path.suffix == self.input_extension
-        output_match = self.output_extension is None or self.output_file_path.suffix == self.output_extension
+        input_match = self.input_extension is None or self.input_file_path.name.endswith(self.input_extension)
+        output_match = self.output_extension is None or self.output_file_path.name.endswith(self.output_extension)
         return input_match and output_match
 
 
+# token attributes tokenize_ner reads through doc.to_array, in row order
+_NER_ATTRS = [ENT_IOB, ENT_TYPE, NORM, IS_ALPHA, ORTH]
+# and the ones tokenize reads
+_TOKENIZE_ATTRS = [IS_ALPHA, NORM]
+# spacy's integer IOB codes (0 = no tag set)
+_IOB_I, _IOB_O, _IOB_B = 1, 2, 3
+_IOB_TAGS = ('', 'I', 'O', 'B')
+# underscore-joined words from TextCleaner (e.g. rock_n_roll), kept like a named entity
+_UNDERSCORE_WORD_PATTERN = re.compile(r'[a-zA-Z]+(?:_[a-zA-Z]+)+')
+# for the regex tokenizer: sentence boundaries (whitespace after ., ! or ?) and the punctuation the cleaners leave on words
+_SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+')
+_WORD_PUNCTUATION = '.,?!:;"\''
+
+
+@lru_cache(maxsize=4)
+def _load_spacy(model_name: str, excluded: Tuple[str, ...], sentencizer: bool) -> Language:
+
+    # loading en_core_web_sm takes about a second, which dominates short files when there's one creator per file
+    # cached per process, so instances with the same settings (and each pool worker's unpickled copy) share one pipeline
+
+    nlp = spacy.load(model_name, exclude=list(excluded))
+    if sentencizer:
+        nlp.add_pipe("sentencizer", first=True)
+    return nlp
+
+
 class SentenceListCreator(FileFunction):
 
     # transforms a text file into a json containing a list of lists of sentence tokens (as specified by gensim's w2v)
@@ -92,15 +204,30 @@ class SentenceListCreator(FileFunction):
     def __init__(self,
                  ner: bool = False,
                  chunk_size: Optional[int] = 500000,
-                 batch_size: Optional[int] = 1,
-                 n_process: Optional[int] = 4
+                 batch_size: Optional[int] = None, # None reads SENTENCE_LIST_BATCH_SIZE from the environment (default 64)
+                 n_process: Optional[int] = None, # None reads SENTENCE_LIST_N_PROCESS from the environment (default 1)
+                 parallel_shards: Optional[int] = 1, # input byte ranges tokenized in separate processes, None uses all cores this process may run on
+                 output_extension: str = ".json", # or ".jsonl": one sentence list per line, no enclosing array
+                 regex_tokenizer: bool = False, # split sentences/words with regexes instead of spacy (no ner), see tokenize_regex
+                 sentencizer: bool = False, # rule-based sentence splitting (punctuation) instead of the dependency parser, much faster
+                 nlp: Optional[Language] = None # already loaded pipeline to share between instances (needs the ner component if ner)
                  ) -> None:
 
+        if output_extension not in [".json", ".jsonl"]:
+            logger.error(f"Invalid output extension: {output_extension}")
+            raise TypeError("Output must be .json or .jsonl file.")
+
+        if ner and regex_tokenizer:
+            logger.error("The regex tokenizer can't do named entity recognition.")
+            raise ValueError("ner and regex_tokenizer can't be combined.")
+
         self.input_extension = ".txt"
-        self.output_extension = ".json"
+        self.output_extension = output_extension
         super().__init__(self.input_extension, self.output_extension)
 
         self.ner = ner # whether to use spacy's named entity recognition
+        self.regex_tokenizer = regex_tokenizer
+        self.sentencizer = sentencizer
         self.MERGE_LABELS = {"PERSON", "ORG", "GPE", "LOC", "FAC", "PRODUCT", "EVENT", "LAW", "WORK_OF_ART", "LANGUAGE"}
         self.REPLACE_LABELS = {
             "CARDINAL": "<cardinal>",
@@ -112,18 +239,55 @@ class SentenceListCreator(FileFunction):
             "TIME": "<time>"
         }
 
+        self.nlp = nlp
+        self._own_nlp = nlp is None # a pipeline passed in by the caller is kept as is, never swapped for a reloaded one
+        if self.nlp is None and not self.regex_tokenizer:
+            self.load_model()
+
+        self.chunk_size = chunk_size
+        # the env vars let slurm scripts tune spacy's pipe without code changes: match the worker count to --cpus-per-task,
+        # raise the batch size (a few hundred) for many short lines or with n_process > 1 (or ipc eats the gain), keep it low for few huge ones
+        self.batch_size = batch_size if batch_size is not None else int(os.getenv("SENTENCE_LIST_BATCH_SIZE", 64))
+        self.n_process = n_process if n_process is not None else int(os.getenv("SENTENCE_LIST_N_PROCESS", 1))
+        self._norm_words = {} # norm hash -> its lowercased words, filled as tokens come in (hashes are stable per model)
+        self.parallel_shards = parallel_shards if parallel_shards is not None else _available_cpus() # each shard loads its own model, so stay inside the allocation
+
+
+    def load_model(self) -> None:
+
+        # components the tokenizers never read are left out at load time (exclude, unlike disable, doesn't build them at all)
+        # the parser stays for doc.sents, unless the sentencizer replaces it (then its tok2vec can go too, ner has its own)
+        excluded = ["tagger", "attribute_ruler", "lemmatizer"] + ([] if self.ner else ["ner"])
+        if self.sentencizer:
+            excluded += ["tok2vec", "parser"]
+
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = _load_spacy("en_core_web_sm", tuple(excluded), self.sentencizer)
             logger.info(f"SpaCy model ({self.nlp}) loaded successfully")
         except Exception as e:
                 logger.error(f"Error loading SpaCy model: {e}")
                 raise
 
-        self.chunk_size = chunk_size
-        self.batch_size = batch_size
-        self.n_process = n_process
-        
-        self.sentence_list = []      
+
+    def __getstate__(self) -> dict:
+
+        # FileProcessor's worker pool pickles the function once per worker – send the settings, not the whole spacy pipeline
+        # the worker reloads the model itself, once, in __setstate__
+        # (unless the pipeline came from the caller: that one travels along, since only it has the caller's configuration)
+
+        state = self.__dict__.copy()
+        if self._own_nlp:
+            del state["nlp"]
+        state["_norm_words"] = {}
+        return state
+
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if self._own_nlp:
+            self.nlp = None
+            if not self.regex_tokenizer:
+                self.load_model()
 
 
     def map(self) -> None:
@@ -133,40 +297,122 @@ class SentenceListCreator(FileFunction):
         try: 
             logger.info(f"Processing text file: {self.input_file_path}")
 
-            with open(self.input_file_path, 'r', encoding='utf-8') as f:
-                total_lines = sum(1 for _ in f)
-            logger.info(f"Total lines in file: {total_lines}")
-
-            with open(self.input_file_path, 'r', encoding='utf-8') as input_file:
-                
-                for i, line in enumerate(input_file):
-            
-                    chunks = self.chunk(line, self.chunk_size)
-                    
-                    if self.ner: # ner
-                        docs = self.nlp.pipe(chunks, disable=['tagger', 'attribute_ruler', 'lemmatizer'], 
-                                            batch_size=self.batch_size, n_process=self.n_process)
-                        self.sentence_list.extend(self.tokenize_ner(docs, i, total_lines, len(chunks)))
-                    else: # no ner
-                        docs = self.nlp.pipe(chunks, disable=['tagger', 'attribute_ruler', 'lemmatizer', 'ner'],
-                                batch_size=self.batch_size, n_process=self.n_process)
-                        self.sentence_list.extend(self.tokenize(docs, i, total_lines, len(chunks)))
-                    
-                    self.sentence_list.append(["i", "love", "blueberry", "waffles"])
-
-            logger.info(f"Writing {len(self.sentence_list)} sentences to json file")
-            try:
-                with open(self.output_file_path, 'w') as output_file:
-                    json.dump(self.sentence_list, output_file, ensure_ascii=False)
-            except Exception as e:
-                logger.error(f"Failed to write output file: {e}")
-                raise
+            # sentences are streamed straight to disk as one json array ('[', comma-separated sentences, ']')
+            # instead of collecting the whole corpus in memory first – the result is the same list of lists
+            # one sentence per line, so the file also splits cleanly by line (strip the trailing comma) for parallel readers
+            # (.jsonl output drops the brackets and commas)
+            if self.parallel_shards > 1:
+                sentence_count = self.map_sharded()
+            else:
+                # 1MB buffers: every sentence is its own small write
+                with open(self.input_file_path, 'r', encoding='utf-8', buffering=1 << 20) as input_file, \
+                     open(self.output_file_path, 'wb', buffering=1 << 20) as output_file: # orjson returns utf-8 bytes
+                    opening, _, closing = self._framing()
+                    output_file.write(opening)
+                    sentence_count = self.write_sentences(input_file, output_file)
+                    if sentence_count or self.output_extension == ".json": # an empty .jsonl file stays empty
+                        output_file.write(closing)
+
+            logger.info(f"Wrote {sentence_count} sentences to json file")
         
         except Exception as e:
             logger.error(f"Error processing text file: {e}")
             raise
 
 
+    def _framing(self) -> tuple:
+
+        # (opening, separator, closing) bytes around the sentence lists for the output format
+
+        if self.output_extension == ".jsonl":
+            return b'', b'\n', b'\n'
+        return b'[\n', b',\n', b'\n]\n'
+
+
+    def write_sentences(self, lines: Iterator[str], output_file) -> int:
+
+        # runs lines through the pipe and writes their sentences, each line followed by the stop sentinel,
+        # as json lists separated by ',\n' (without the enclosing brackets), or by '\n' for .jsonl
+        # returns the number of lists written
+
+        sentence_count = 0
+        first = True
+        _, separator, _ = self._framing()
+
+        def gen_chunks():
+            # every line gives at least one chunk (lines from a file iterator are never empty)
+            # chunks are tagged with (line index, chunk count) so they can be regrouped by line after the pipe
+            for i, line in enumerate(lines):
+                chunks = self.chunk(line, self.chunk_size)
+                for chunk in chunks:
+                    yield chunk, (i, len(chunks))
+
+        if self.regex_tokenizer:
+            line_sentences = (self.tokenize_regex(line) for line in lines)
+        else:
+            # one pipe over the whole file, so batches aren't cut off at line boundaries
+            docs = self.nlp.pipe(gen_chunks(), as_tuples=True, batch_size=self.batch_size, n_process=self.n_process)
+            tokenize = self.tokenize_ner if self.ner else self.tokenize
+            line_sentences = (tokenize((doc for doc, _ in line_docs), i, num_chunks)
+                              for (i, num_chunks), line_docs in groupby(docs, key=itemgetter(1)))
+
+        for sentences in line_sentences:
+
+            for sentence in sentences:
+                output_file.write((b'' if first else separator) + orjson.dumps(sentence))
+                first = False
+                sentence_count += 1
+
+            # stop sentinel marking the end of a line (one podcast/article) – GloVeFormatter, remove_seq and the db scripts rely on it
+            output_file.write((b'' if first else separator) + orjson.dumps(["i", "love", "blueberry", "waffles"]))
+            first = False
+            sentence_count += 1
+
+        return sentence_count
+
+
+    def map_sharded(self) -> int:
+
+        # splits the input into parallel_shards byte ranges (cut at line starts), tokenizes each range in its own
+        # process with a single-process pipe, then stitches the shard outputs together into one json array
+        # returns the number of lists written
+
+        size = os.path.getsize(self.input_file_path)
+        bounds = [0]
+        with open(self.input_file_path, 'rb') as input_file:
+            for k in range(1, self.parallel_shards):
+                input_file.seek(max(size * k // self.parallel_shards, bounds[-1]))
+                input_file.readline() # snap forward to the start of the next line
+                bounds.append(input_file.tell())
+        bounds.append(size)
+
+        shard_paths = [self.output_file_path.with_name(f"{self.output_file_path.name}.shard{k}") for k in range(self.parallel_shards)]
+        logger.info(f"Tokenizing {self.input_file_path} in {self.parallel_shards} shards")
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.parallel_shards, initializer=_init_slc_worker, initargs=(self,)) as executor:
+                counts = list(executor.map(_slc_shard, repeat(self.input_file_path), bounds[:-1], bounds[1:], shard_paths))
+
+            opening, separator, closing = self._framing()
+            with open(self.output_file_path, 'wb') as output_file:
+                output_file.write(opening)
+                first = True
+                for shard_path, count in zip(shard_paths, counts):
+                    if count: # empty shards (no lines in range) would leave a dangling comma
+                        if not first:
+                            output_file.write(separator)
+                        with open(shard_path, 'rb') as shard_file:
+                            shutil.copyfileobj(shard_file, output_file, 1 << 20)
+                        first = False
+                if not first or self.output_extension == ".json": # an empty .jsonl file stays empty
+                    output_file.write(closing)
+        finally:
+            for shard_path in shard_paths:
+                shard_path.unlink(missing_ok=True)
+
+        return sum(counts)
+
+
     def chunk(self, text: str, chunk_size: int = 500000):
 
         text_chunks = []
@@ -188,83 +434,141 @@ class SentenceListCreator(FileFunction):
         return text_chunks
 
 
-    def tokenize_ner(self, docs: Iterator[Doc], line_num: int, num_lines: int, num_chunks: int) -> List[List[str]]:
+    def tokenize_ner(self, docs: Iterator[Doc], line_num: int, num_chunks: int) -> Iterator[List[str]]:
         
-        # returns sentence list, but with named entities as single tokens
+        # yields sentences, but with named entities as single tokens
         # Lebron James -> lebron_james
 
-        sentences = []
+        # bound once instead of looked up for every entity/token
+        merge_labels = self.MERGE_LABELS
+        replace_labels = self.REPLACE_LABELS
+        is_underscore_word = _UNDERSCORE_WORD_PATTERN.fullmatch
 
         for j, doc in enumerate(docs):
-            logger.info(f"Processing chunk {j} of {num_chunks} in line {line_num} of {num_lines}.") # num_chunks is just for visualizing speed
+            logger.info(f"Processing chunk {j} of {num_chunks} in line {line_num}.") # num_chunks is just for visualizing speed
             try:
+                # one row of plain ints per token instead of Token objects (every token.ent_iob_/norm_/... access builds a python object)
+                strings = doc.vocab.strings
+                rows = doc.to_array(_NER_ATTRS).tolist()
+                norm_words = self._norm_words
+
                 for sentence in doc.sents:
 
                     sentence_words = []
-                    i = 0
+                    i = sentence.start
+                    end = sentence.end
 
-                    while i < len(sentence):
-                        token = sentence[i]
-                        print(token)
-                        print(token.ent_iob_)
+                    while i < end:
+                        iob, ent_type, norm, is_alpha, orth = rows[i]
 
-                        if token.ent_iob_ == 'B':
-                            ent_type = token.ent_type_
-                            ent_tokens = [token.norm_.lower()]
+                        if iob == _IOB_B:
+                            ent_type = strings[ent_type]
+                            ent_tokens = [strings[norm].lower()]
                             i += 1
-                            while i < len(sentence) and sentence[i].ent_iob_ == 'I':
-                                ent_tokens.append(sentence[i].norm_.lower())
+                            while i < end and rows[i][0] == _IOB_I:
+                                ent_tokens.append(strings[rows[i][2]].lower())
                                 i += 1
 
-                            if ent_type in self.MERGE_LABELS:
+                            if ent_type in merge_labels:
                                 sentence_words.append("_".join(ent_tokens))
-                            elif ent_type in self.REPLACE_LABELS:
-                                sentence_words.append(self.REPLACE_LABELS[ent_type])
+                            elif ent_type in replace_labels:
+                                sentence_words.append(replace_labels[ent_type])
                             else:
                                 sentence_words.extend(ent_tokens)
                             
-                        elif token.ent_iob_ == 'O':
-                            if token.is_alpha:
-                                norm = token.norm_.lower()
-                                sentence_words.extend(norm.split())
-                            elif re.fullmatch(r'[a-zA-Z]+(?:_[a-zA-Z]+)+', token.text): # see TextCleaner; removes 93_FM and stuff, is that what you want? maybe use r'\w+(?:_\w+)+' instead -> no, don't risk, not worth it
-                                sentence_words.extend(token.norm_.lower().split()) # like a named entity
+                        elif iob == _IOB_O:
+                            if is_alpha:
+                                words = norm_words.get(norm)
+                                if words is None:
+                                    words = norm_words[norm] = strings[norm].lower().split()
+                                sentence_words.extend(words)
+                            elif is_underscore_word(strings[orth]): # see TextCleaner; removes 93_FM and stuff, is that what you want? maybe use r'\w+(?:_\w+)+' instead -> no, don't risk, not worth it
+                                sentence_words.extend(strings[norm].lower().split()) # like a named entity
                             i += 1
                         else:
-                            logger.error(f"Unexpected IOB tag '{token.ent_iob_}' at token '{token.text}'")
-                            raise ValueError(f"Unexpected IOB tag '{token.ent_iob_}'")
+                            logger.error(f"Unexpected IOB tag '{_IOB_TAGS[iob]}' at token '{strings[orth]}'")
+                            raise ValueError(f"Unexpected IOB tag '{_IOB_TAGS[iob]}'")
                     
                     if sentence_words: # fix
-                        sentences.append(sentence_words)
+                        yield sentence_words
                 
                 logger.info(f"Successfully processed chunk {j}")
                     
             except Exception as e:
                 logger.error(f"Error processing chunk {j}: {e}")
                 raise
-
-        return sentences
     
 
-    def tokenize(self, docs: Iterator[Doc], line_num: int, num_lines: int, num_chunks: int) -> List[List[str]]:
-        sentences = []
+    def tokenize(self, docs: Iterator[Doc], line_num: int, num_chunks: int) -> Iterator[List[str]]:
 
         for i, doc in enumerate(docs):
-            logger.info(f"Processing chunk {i} of {num_chunks} in line {line_num} of {num_lines}.")
+            logger.info(f"Processing chunk {i} of {num_chunks} in line {line_num}.")
             try:
+                # same as tokenize_ner: plain int rows instead of Token objects
+                strings = doc.vocab.strings
+                rows = doc.to_array(_TOKENIZE_ATTRS).tolist()
+                norm_words = self._norm_words # a corpus reuses few words a lot, so the string lookup/lower/split is done once per word
+
                 for sentence in doc.sents:
                     sentence_words = []
-                    for token in sentence:
-                        if token.is_alpha:
-                            sentence_words.extend(token.norm_.lower().split())  # flattening
+                    for is_alpha, norm in rows[sentence.start:sentence.end]:
+                        if is_alpha:
+                            words = norm_words.get(norm)
+                            if words is None:
+                                words = norm_words[norm] = strings[norm].lower().split()
+                            sentence_words.extend(words)  # flattening
                     if sentence_words:
-                        sentences.append(sentence_words)
+                        yield sentence_words
                 logger.info(f"Successfully processed chunk {i}")
             except Exception as e:
                 logger.error(f"Error tokenizing chunk: {e}")
                 raise
 
-        return sentences
+
+    def tokenize_regex(self, line: str) -> Iterator[List[str]]:
+
+        # yields the sentences of one line without spacy: split after ., ! or ? followed by whitespace, then on whitespace,
+        # keeping the lowercased tokens that are alphabetic once the surrounding punctuation is stripped
+        # meant for TextCleaner/NewsCleaner output (only word characters and .,?!:;"' left) and much faster than the parser,
+        # but not identical to tokenize: no parser sentence boundaries, no spacy norms (e.g. "cuz" stays "cuz"),
+        # and tokens spacy would split (e.g. "cannot") stay whole
+
+        for sentence in _SENTENCE_BOUNDARY_PATTERN.split(line):
+            sentence_words = [word.lower() for word in (token.strip(_WORD_PUNCTUATION) for token in sentence.split()) if word.isalpha()]
+            if sentence_words:
+                yield sentence_words
+
+
+# worker side of SentenceListCreator.map_sharded: one instance (and so one loaded spacy model) per process
+_slc_worker = None
+
+def _init_slc_worker(creator: SentenceListCreator) -> None:
+    # creator arrives pickled without its model and reloads it in __setstate__, so every setting carries over
+    global _slc_worker
+    _slc_worker = creator
+    _slc_worker.n_process = 1 # no nested forks
+    _slc_worker.parallel_shards = 1
+
+def _iter_lines_in_range(path: Path, start: int, end: int) -> Iterator[str]:
+    # lines starting in [start, end), split on b'\n' only (the cleaners' output has no bare '\r' that text mode would split on)
+    # crlf line ends become '\n' like in text mode, so shards see the same lines as the sequential path
+    with open(path, 'rb', buffering=1 << 20) as f:
+        f.seek(start)
+        pos = start
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            if line.endswith(b'\r\n'):
+                line = line[:-2] + b'\n'
+            elif line.endswith(b'\r'): # last line, no newline after it
+                line = line[:-1] + b'\n'
+            yield line.decode('utf-8')
+
+def _slc_shard(input_path: Path, start: int, end: int, shard_path: Path) -> int:
+    with open(shard_path, 'wb', buffering=1 << 20) as shard_file:
+        return _slc_worker.write_sentences(_iter_lines_in_range(input_path, start, end), shard_file)
 
 
 class EntrySimplifier(FileFunction):
@@ -273,7 +577,9 @@ class EntrySimplifier(FileFunction):
                  keep_fields: List[str],
                  keep_labels: bool = True,
                  output_extension: str = ".txt",
-                 nela: bool = False) -> None:
+                 nela: bool = False,
+                 n_workers: int = 1 # jsonl input is split into ~8MB blocks simplified in parallel (nela's single json array can't be split)
+                 ) -> None:
         
         if output_extension not in [".txt", ".jsonl"]:
             logger.error(f"Invalid output extension: {output_extension}")
@@ -284,19 +590,31 @@ class EntrySimplifier(FileFunction):
             raise AttributeError("Please specify at least one field to keep.")
 
         self.keep_fields = keep_fields
+        self._keep_field_set = frozenset(keep_fields)
         self.keep_labels = keep_labels
         self.output_extension = output_extension
         self.nela = nela
         self.date_filter = nela
+        self.n_workers = n_workers
+
+        # the output settings are fixed per instance, so pick the matching writer once instead of branching on every entry
+        if output_extension == ".jsonl":
+            self._write_entry = self._write_jsonl_labeled if keep_labels else self._write_jsonl
+        else:
+            self._write_entry = self._write_txt_labeled if keep_labels else self._write_txt
 
         input_ext = ".json" if nela else ".jsonl"
         super().__init__(input_ext, output_extension)
 
     def _filter_fields(self, entry: dict, line_id: int) -> List[str]:
+        # nearly every entry has all the fields – one c-level subset check instead of a membership test per field
+        if entry.keys() >= self._keep_field_set:
+            return self.keep_fields
         valid_fields = []
+        append = valid_fields.append
         for field in self.keep_fields:
             if field in entry:
-                valid_fields.append(field)
+                append(field)
             else:
                 logger.warning(f"Field '{field}' not found in entry {line_id}")
         return valid_fields
@@ -309,57 +627,126 @@ class EntrySimplifier(FileFunction):
         """
         if not isinstance(field_value, str):
             field_value = str(field_value)
-        # Replace \r, \n, and other unicode line separators with space
-        sanitized = field_value.replace('\r', ' ').replace('\n', ' ').replace('\u2028', ' ').replace('\u2029', ' ')
-        # Collapse multiple spaces to one
-        sanitized = ' '.join(sanitized.split())
-        return sanitized
-
-    def _write_entry(self, outfile, entry: dict, valid_fields: List[str]) -> None:
-        if self.output_extension == ".jsonl":
-            if self.keep_labels:
-                simplified = {field: entry[field] for field in valid_fields}
-            else:
-                simplified = [entry[field] for field in valid_fields]
-            outfile.write(json.dumps(simplified, ensure_ascii=False) + '\n')
-        elif self.output_extension == ".txt":
-            if self.keep_labels:
-                simplified = ", ".join(f"{field}: {self.sanitize_field(entry[field])}" for field in valid_fields)
-            else:
-                simplified = ", ".join(self.sanitize_field(entry[field]) for field in valid_fields)
-            outfile.write(simplified + '\n')
-            self._txt_lines_written += 1  # Track lines written for .txt
-        else:
-            raise ValueError(f"Unsupported output extension: {self.output_extension}")
+        # Collapse all whitespace runs to one space – str.split() already splits on
+        # \r, \n and the unicode line separators (\u2028, \u2029), so one pass covers them
+        return ' '.join(field_value.split())
+
+    # the _write_* methods append one entry to map's output buffer, which is flushed to disk in ~1MB blocks
+    # __init__ binds the one matching the output settings as self._write_entry
+
+    def _write_jsonl_labeled(self, output_buffer: bytearray, entry: dict, valid_fields: List[str]) -> None:
+        output_buffer += orjson.dumps({field: entry[field] for field in valid_fields})
+        output_buffer += b'\n'
+
+    def _write_jsonl(self, output_buffer: bytearray, entry: dict, valid_fields: List[str]) -> None:
+        output_buffer += orjson.dumps([entry[field] for field in valid_fields])
+        output_buffer += b'\n'
+
+    def _write_txt_labeled(self, output_buffer: bytearray, entry: dict, valid_fields: List[str]) -> None:
+        sanitize_field = self.sanitize_field
+        output_buffer += ", ".join(f"{field}: {sanitize_field(entry[field])}" for field in valid_fields).encode('utf-8')
+        output_buffer += b'\n'
+        self._txt_lines_written += 1  # Track lines written for .txt
+
+    def _write_txt(self, output_buffer: bytearray, entry: dict, valid_fields: List[str]) -> None:
+        sanitize_field = self.sanitize_field
+        output_buffer += ", ".join(sanitize_field(entry[field]) for field in valid_fields).encode('utf-8')
+        output_buffer += b'\n'
+        self._txt_lines_written += 1  # Track lines written for .txt
+
+    def _simplify_line(self, output_buffer: bytearray, line: bytes, line_num: int) -> int:
+        # parses one jsonl line and appends its simplified form to output_buffer
+        # returns 1 if the entry was written, 0 if the line was bad (logged, not raised)
+        try:
+            entry = orjson.loads(line)
+            fields = self._filter_fields(entry, line_num)
+            self._write_entry(output_buffer, entry, fields)
+            return 1
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Invalid JSON at line {line_num}: {e}")
+        except Exception as e:
+            logger.error(f"Error at line {line_num}: {e}")
+        return 0
+
+    def map_parallel(self, infile, outfile) -> Tuple[int, int]:
+        # reads the input in blocks cut at line ends and simplifies them in a process pool, writing results in input order
+        # at most two blocks per worker are in flight, so memory stays bounded for multi-GB files
+        # returns (lines read, entries written)
+        line_count = 0
+        written_entries = 0
+        in_flight = deque()
+
+        def collect(future) -> None:
+            nonlocal line_count, written_entries
+            output, lines, written, txt_lines = future.result()
+            outfile.write(output)
+            line_count += lines
+            written_entries += written
+            self._txt_lines_written += txt_lines
+
+        with ProcessPoolExecutor(max_workers=self.n_workers, initializer=_init_es_worker,
+                                 initargs=(self.keep_fields, self.keep_labels, self.output_extension)) as executor:
+            first_line = 1
+            while True:
+                block = infile.read(8 << 20)
+                if not block:
+                    break
+                block += infile.readline() # finish the last line
+                in_flight.append(executor.submit(_es_block, block, first_line))
+                first_line += block.count(b'\n')
+                if len(in_flight) >= 2 * self.n_workers:
+                    collect(in_flight.popleft())
+            while in_flight:
+                collect(in_flight.popleft())
+
+        return line_count, written_entries
 
     def map(self) -> None:
         self._txt_lines_written = 0  # Reset counter for .txt output
         written_entries = 0  # Count entries actually written
 
         try:
-            with open(self.input_file_path, 'r', encoding='utf-8') as infile, \
-                 open(self.output_file_path, 'w', encoding='utf-8') as outfile:
+            # binary on both ends: orjson parses bytes and serializes to bytes
+            # 1MB read buffer (output goes through its own 1MB bytearray, so the writer's default buffer is never hit)
+            with open(self.input_file_path, 'rb', buffering=1 << 20) as infile, \
+                 open(self.output_file_path, 'wb') as outfile:
+
+                output_buffer = bytearray()
 
                 if self.date_filter:
+                    # nela files are one big json array – stream the entries one at a time instead of loading the whole file
+                    # floats instead of Decimals, so orjson can dump them; 1MB reads like the file buffer (ijson defaults to 64KB)
+                    events = ijson.parse(infile, buf_size=1 << 20, use_float=True)
                     try:
-                        all_data = json.load(infile)
-                    except json.JSONDecodeError as e:
+                        first_event = next(events, ('', None, None))
+                    except ijson.JSONError as e:
                         logger.error(f"Failed to parse JSON: {e}")
                         raise
 
-                    if not isinstance(all_data, list):
+                    if first_event[1] != 'start_array':
                         raise ValueError("Expected a list of JSON entries.")
 
-                    lower_bound = datetime.strptime("2020-05-01", "%Y-%m-%d")
-                    upper_bound = datetime.strptime("2020-06-30", "%Y-%m-%d")
+                    lower_bound = date(2020, 5, 1)
+                    upper_bound = date(2020, 6, 30)
 
                     total = 0
                     kept = 0
-                    for i, entry in enumerate(all_data, 1):
+                    # bound once, not looked up on self for every entry
+                    filter_fields = self._filter_fields
+                    write_entry = self._write_entry
+                    fromisoformat = date.fromisoformat
+                    strptime = datetime.strptime
+                    for i, entry in enumerate(ijson.items(chain([first_event], events), 'item'), 1):
                         total += 1
                         date_str = entry.get("date", "")[:10]
                         try:
-                            date_val = datetime.strptime(date_str, "%Y-%m-%d")
+                            # the usual zero-padded YYYY-MM-DD goes through c-level fromisoformat, much cheaper than strptime's format parsing
+                            # anything else (e.g. unpadded 2020-5-3) gets strptime, which accepts exactly what the filter always took
+                            # (fromisoformat alone would drop unpadded dates, and from 3.11 on accept forms like 2020-W18-7)
+                            if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+                                date_val = fromisoformat(date_str)
+                            else:
+                                date_val = strptime(date_str, "%Y-%m-%d").date()
                         except ValueError:
                             logger.warning(f"Invalid date in entry {i}; skipping.")
                             continue
@@ -367,28 +754,33 @@ class EntrySimplifier(FileFunction):
                             continue
 
                         kept += 1
-                        fields = self._filter_fields(entry, i)
-                        self._write_entry(outfile, entry, fields)
+                        fields = filter_fields(entry, i)
+                        write_entry(output_buffer, entry, fields)
                         written_entries += 1
+                        if len(output_buffer) >= 1 << 20:
+                            outfile.write(output_buffer)
+                            output_buffer.clear()
 
                     logger.info(f"Processed {total} entries, kept {kept} after date filtering.")
                 
+                elif self.n_workers > 1:
+                    line_count, written_entries = self.map_parallel(infile, outfile)
+                    logger.info(f"Processed {line_count} entries.")
+
                 else:
                     line_count = 0
+                    simplify_line = self._simplify_line
                     for line in infile:
                         line_count += 1
-                        try:
-                            entry = json.loads(line)
-                            fields = self._filter_fields(entry, line_count)
-                            self._write_entry(outfile, entry, fields)
-                            written_entries += 1
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Invalid JSON at line {line_count}: {e}")
-                        except Exception as e:
-                            logger.error(f"Error at line {line_count}: {e}")
+                        written_entries += simplify_line(output_buffer, line, line_count)
+                        if len(output_buffer) >= 1 << 20:
+                            outfile.write(output_buffer)
+                            output_buffer.clear()
 
                     logger.info(f"Processed {line_count} entries.")
 
+                outfile.write(output_buffer)
+
             # Assert output line count matches processed entries for .txt files
             if self.output_extension == ".txt":
                 assert self._txt_lines_written == written_entries, (
@@ -401,6 +793,65 @@ class EntrySimplifier(FileFunction):
             raise
 
 
+# worker side of EntrySimplifier.map_parallel: one instance per process
+_es_worker = None
+
+def _init_es_worker(keep_fields: List[str], keep_labels: bool, output_extension: str) -> None:
+    global _es_worker
+    _es_worker = EntrySimplifier(keep_fields, keep_labels=keep_labels, output_extension=output_extension)
+
+def _es_block(block: bytes, first_line: int) -> Tuple[bytes, int, int, int]:
+    # simplifies the lines of one block, returns (output, lines read, entries written, txt lines written)
+    _es_worker._txt_lines_written = 0
+    output_buffer = bytearray()
+    lines = block.split(b'\n')
+    if not lines[-1]: # block ends with a newline
+        lines.pop()
+    written = 0
+    simplify_line = _es_worker._simplify_line
+    for line_num, line in enumerate(lines, first_line):
+        written += simplify_line(output_buffer, line, line_num)
+    return bytes(output_buffer), len(lines), written, _es_worker._txt_lines_written
+
+
+# characters the non-speaker regexes in TextCleaner need to match at all
+_NON_SPEAKER_CHARS = frozenset('[({<*/~\\')
+
+# delimited spans (no \s or \w, so re2's ascii-only classes don't change anything)
+# compiled with re2 where available – python's backtracking engine does badly on long lines here
+# kept at module level so TextCleaner instances stay picklable for FileProcessor's worker pool
+# the four bracket types share one alternation, so a line is swept once instead of four times
+# this is an intended change to the cleaned output: it differs from running the four passes one after another
+# whenever spans of different bracket types overlap – crossed brackets like "(a [b) c]", and also an unclosed opener
+# of one type inside another type's span (e.g. "<< x (( >> y ]] z (( ... (w)": the round-bracket pass used to remove
+# "(( >> y ]] z (( ... (w)" and keep "<< x", the alternation starts at the leftmost opener of any type, removes "<< x (( >"
+# and "(( ... (w)" instead, and keeps "> y ]] z")
+# negated classes instead of lazy .*? – same matches (lines never contain a newline), but no backtracking when re2 isn't installed
+_BRACKET_PATTERN = re2.compile(r'\[[^\]]*\]|\([^)]*\)|\{[^}]*\}|<[^>]*>') # [text], (text), {text}, <text>
+_TILDE_PATTERN = re2.compile(r'~[^~]*~') # ~text~
+
+# the rest of TextCleaner's per-line regexes, compiled once instead of going through re's pattern cache on every call
+# (these use \s/\w/\b, so they stay on python's unicode-aware re)
+_STAR_PATTERN = re.compile(r'\s\*[a-zA-Z\s]+\*\s') # *text*
+_SLASH_PATTERN = re.compile(r'\s/+\w+/+\s') # //text/
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_ANGLE_RUN_PATTERN = re.compile(r'[<>]+')
+# the possessives stay two passes: the plural one also has to catch what the singular one leaves behind ("boss's'" -> "boss'")
+_SINGULAR_POSSESSIVE_PATTERN = re.compile(r"\b(\w+)[’']s\b")
+_PLURAL_POSSESSIVE_PATTERN = re.compile(r"\b(\w+s)[’'](?=\s|$|[.,;:!?—…‘’“”\"\'\-\)])")
+_LONE_APOSTROPHE_PATTERN = re.compile(r'(?<=\s)[\'’](?=\s)')
+_LEADING_APOSTROPHE_PATTERN = re.compile(r"\b[’']\s+")
+_TRAILING_APOSTROPHE_PATTERN = re.compile(r"\s+[’']\b")
+_INNER_APOSTROPHE_PATTERN = re.compile(r"(?<=\w)[’'](?=\w)")
+_UNDERSCORE_RUN_PATTERN = re.compile(r'_+')
+_LONE_UNDERSCORE_PATTERN = re.compile(r'(?<=\s)_+(?=\s)')
+_APOSTROPHE_PATTERN = re.compile(r"[’']")
+_NON_PUNCT_PATTERN = re.compile(r'[^\w\s\.\,\?\!\:\;_]')
+_INNER_COLON_PATTERN = re.compile(r'(?<=\S)[;:]+(?=\S)')
+
+# underscores, hyphens, en- and em-dashes all become spaces (one translate pass instead of one pass each)
+_DASH_TABLE = str.maketrans({'_': ' ', '-': ' ', '–': ' ', '—': ' '})
+
 class TextCleaner(FileFunction):
 
     # can remove all sorts of non-speaker content (marked all sorts of ways) and extend contractions
@@ -431,87 +882,100 @@ class TextCleaner(FileFunction):
 
         try:
             logger.info(f"Processing text file: {self.input_file_path}")
-            with open(self.input_file_path, 'r', encoding='utf-8') as input_file, \
-                 open(self.output_file_path, 'w', encoding='utf-8') as output_file:
+            with open(self.input_file_path, 'rb') as input_file, \
+                 open(self.output_file_path, 'wb') as output_file:
 
-                for line_num, line in enumerate(input_file, 1): # Process line by line
-                    # 1. Remove the trailing newline character for processing
+                output_buffer = bytearray() # flushed to disk in ~1MB blocks
+
+                # Bind per-line lookups to locals once
+                remove_non_speaker_content = self.remove_non_speaker_content
+                contraction_level = self.contraction_level
+                fix_contractions = _fix_contractions
+                whitespace_sub = _WHITESPACE_PATTERN.sub
+
+                # per-line events are counted and summarized once per file, only logged line by line at debug level
+                debug = logger.isEnabledFor(logging.DEBUG)
+                empty_lines = 0
+
+                for line_num, line in enumerate(_iter_mmap_lines(input_file), 1): # Process line by line
+                    # 1. Lines come without their trailing newline
                     # This ensures regexes don't accidentally match across lines and
                     # that we control the final newline.
-                    processed_line_content = line.rstrip('\n')
+                    processed_line_content = line.decode('utf-8')
 
-                    if self.remove_non_speaker_content:
+                    if remove_non_speaker_content:
                         # logger.debug(f"Before removal: '{processed_line_content}'") # For detailed debugging
                         
-                        # Apply regexes to the current line content
-                        # Replace with a single space to prevent words from concatenating
-                        processed_line_content = re.sub(r'\[.*?\]', ' ', processed_line_content) # [text]
-                        processed_line_content = re.sub(r'\(.*?\)', ' ', processed_line_content) # (text)
-                        processed_line_content = re.sub(r'\{.*?\}', ' ', processed_line_content) # {text}
-                        processed_line_content = re.sub(r'<.*?>', ' ', processed_line_content) # <text>
-                        
-                        # Note: \s will match spaces, tabs, newlines.
-                        # Since we've rstrip('\n')ed the line, \s will primarily match spaces/tabs within the line.
-                        # The original regex \s\*...*\s is specifically designed for content with *leading and trailing spaces*.
-                        processed_line_content = re.sub(r'\s\*[a-zA-Z\s]+\*\s', ' ', processed_line_content) # *text*
-                        
-                        # These now replace with a space to prevent concatenation
-                        processed_line_content = re.sub(r'\s/+\w+/+\s', ' ', processed_line_content) # //text/
-                        processed_line_content = re.sub(r'~.*?~', ' ', processed_line_content) # ~text~
-                        
-                        processed_line_content = re.sub(r'\\', '', processed_line_content) # remove backslashes (escape characters)
+                        # Most lines contain none of the marker characters, so skip the regexes for those (one C-level scan)
+                        if not _NON_SPEAKER_CHARS.isdisjoint(processed_line_content):
+                            # Apply regexes to the current line content
+                            # Replace with a single space to prevent words from concatenating
+                            processed_line_content = _BRACKET_PATTERN.sub(' ', processed_line_content) # [text], (text), {text}, <text>
+                            
+                            # Note: \s will match spaces, tabs, newlines.
+                            # Since the line comes without its newline, \s will primarily match spaces/tabs within the line.
+                            # The original regex \s\*...*\s is specifically designed for content with *leading and trailing spaces*.
+                            # (each pass is only run if its marker character is in the line at all – same result, fewer scans;
+                            # they can't be fused into one alternation since a removal can create the \s the next pattern needs)
+                            if '*' in processed_line_content:
+                                processed_line_content = _STAR_PATTERN.sub(' ', processed_line_content) # *text*
+                            
+                            # These now replace with a space to prevent concatenation
+                            if '/' in processed_line_content:
+                                processed_line_content = _SLASH_PATTERN.sub(' ', processed_line_content) # //text/
+                            if '~' in processed_line_content:
+                                processed_line_content = _TILDE_PATTERN.sub(' ', processed_line_content) # ~text~
+                            
+                            processed_line_content = processed_line_content.replace('\\', '') # remove backslashes (escape characters)
 
                         # Clean up multiple spaces that might result from replacements, and trim leading/trailing spaces
-                        processed_line_content = re.sub(r'\s+', ' ', processed_line_content).strip()
+                        processed_line_content = whitespace_sub(' ', processed_line_content).strip()
                         # logger.debug(f"After removal: '{processed_line_content}'") # For detailed debugging
 
-                    if self.contraction_level == 1:
+                    if contraction_level == 1:
                         # logger.debug(f"Before contractions: '{processed_line_content}'") # For detailed debugging
-                        processed_line_content = contractions.fix(processed_line_content)
+                        processed_line_content = fix_contractions(processed_line_content)
                         # logger.debug(f"After contractions: '{processed_line_content}'") # For detailed debugging
-                    elif self.contraction_level == 2:
+                    elif contraction_level == 2:
                         logger.error("'contraction_level == 2' hasn't been implemented yet.")
                         raise NotImplementedError("'contraction_level == 2' hasn't been implemented yet.")
                     
                     # Remove greater and less than symbols
-                    processed_line_content = re.sub(r'>+', ' ', processed_line_content) # remove sequences of >
-                    processed_line_content = re.sub(r'<+', ' ', processed_line_content) # remove sequences of <
-                    
-                    # Remove all underscores (swap for whitespace)
-                    processed_line_content = processed_line_content.replace('_', ' ')
+                    processed_line_content = _ANGLE_RUN_PATTERN.sub(' ', processed_line_content) # remove sequences of > and <
                     
-                    # Remove all hyphen types (swap for spaces)
-                    processed_line_content = processed_line_content.replace('-', ' ')
-                    processed_line_content = re.sub(r'[–—]', ' ', processed_line_content)  # en-dash (–), em-dash (—)
-
-                    # Remove possessive suffixes
-                    # Remove singular possessive
-                    processed_line_content = re.sub(r"\b(\w+)[’']s\b", r"\1", processed_line_content)
-                    # Remove plural possessive, apostrophe followed by space, punctuation, or end of string
-                    processed_line_content = re.sub(r"\b(\w+s)[’'](?=\s|$|[.,;:!?—…‘’“”\"\'\-\)])", r"\1", processed_line_content)
-                    # Remove random apostrophes surrounded by space (might help mitigate NER problems)
-                    processed_line_content = re.sub(r'(?<=\s)[\'’](?=\s)', ' ', processed_line_content)
-
-                    # Final apostrophe rules
-                    # Remove apostrophes prefixing or suffixing a word
-                    processed_line_content = re.sub(r"\b[’']\s+", '', processed_line_content)  # Remove apostrophe at start of a word boundary
-                    processed_line_content = re.sub(r"\s+[’']\b", '', processed_line_content)  # Remove apostrophe at end of a word boundary
-                    # Replace apostrophes inside words with underscore (consistent with NER strategy)
-                    processed_line_content = re.sub(r"(?<=\w)[’'](?=\w)", '_', processed_line_content)
-
-                    # Double check underscores
-                    processed_line_content = re.sub(r'_+', '_', processed_line_content)
-                    # Remove stray underscores surrounded by spaces (but not inside words)
-                    processed_line_content = re.sub(r'(?<=\s)_+(?=\s)', ' ', processed_line_content)
-
-                    # Double check apostrophes
-                    processed_line_content = re.sub(r"[’']", " ", processed_line_content)
-
-                    # Remove stray brackets and braces
-                    processed_line_content = re.sub(r'[\[\]\(\)\{\}<>]', ' ', processed_line_content)
+                    # Remove all underscores and hyphen types, incl. en-dash (–) and em-dash (—) (swap for whitespace)
+                    processed_line_content = processed_line_content.translate(_DASH_TABLE)
+
+                    # The possessive, apostrophe and underscore passes below (up to the final apostrophe check) all need an apostrophe to match
+                    # (the underscores they clean up only exist if an inner apostrophe was swapped for one, the dash table removed all others),
+                    # so most lines skip all 8 passes and go straight to the punctuation filter
+                    if "'" in processed_line_content or '’' in processed_line_content:
+                        # Remove possessive suffixes
+                        # Remove singular possessive
+                        processed_line_content = _SINGULAR_POSSESSIVE_PATTERN.sub(r"\1", processed_line_content)
+                        # Remove plural possessive, apostrophe followed by space, punctuation, or end of string
+                        processed_line_content = _PLURAL_POSSESSIVE_PATTERN.sub(r"\1", processed_line_content)
+                        # Remove random apostrophes surrounded by space (might help mitigate NER problems)
+                        processed_line_content = _LONE_APOSTROPHE_PATTERN.sub(' ', processed_line_content)
+
+                        # Final apostrophe rules
+                        # Remove apostrophes prefixing or suffixing a word
+                        processed_line_content = _LEADING_APOSTROPHE_PATTERN.sub('', processed_line_content)  # Remove apostrophe at start of a word boundary
+                        processed_line_content = _TRAILING_APOSTROPHE_PATTERN.sub('', processed_line_content)  # Remove apostrophe at end of a word boundary
+                        # Replace apostrophes inside words with underscore (consistent with NER strategy)
+                        processed_line_content = _INNER_APOSTROPHE_PATTERN.sub('_', processed_line_content)
+
+                        # Double check underscores
+                        processed_line_content = _UNDERSCORE_RUN_PATTERN.sub('_', processed_line_content)
+                        # Remove stray underscores surrounded by spaces (but not inside words)
+                        processed_line_content = _LONE_UNDERSCORE_PATTERN.sub(' ', processed_line_content)
+
+                        # Double check apostrophes
+                        processed_line_content = _APOSTROPHE_PATTERN.sub(" ", processed_line_content)
 
                     # Remove everything but normal punctualization
-                    processed_line_content = re.sub(r'[^\w\s\.\,\?\!\:\;_]', ' ', processed_line_content)
+                    # (this also covers stray brackets and braces: each one becomes a space, like a separate pass would do)
+                    processed_line_content = _NON_PUNCT_PATTERN.sub(' ', processed_line_content)
 
                     # Reduce sequences of punctuation marks to the first character (e.g., ".?;;.:::" -> ".") -> too aggressive, spacy doesn't care anyway
                     # def reduce_punct_seq(match):
@@ -521,10 +985,10 @@ class TextCleaner(FileFunction):
 
                     # Repeated punctuation handling
                     # Replace any sequence of colons and semicolons surrounded by non-whitespace with a single space
-                    processed_line_content = re.sub(r'(?<=\S)[;:]+(?=\S)', ' ', processed_line_content)
+                    processed_line_content = _INNER_COLON_PATTERN.sub(' ', processed_line_content)
 
                     # Final whitespace normalization
-                    processed_line_content = re.sub(r'\s+', ' ', processed_line_content).strip()
+                    processed_line_content = whitespace_sub(' ', processed_line_content).strip()
 
                     # Decide what to write for this line
                     # To preserve line count even for lines that become empty:
@@ -532,18 +996,282 @@ class TextCleaner(FileFunction):
                     
                     # If you want to completely remove lines that become empty/whitespace-only:
                     if processed_line_content: # Only write if there's actual content
-                        output_file.write(processed_line_content + '\n')
+                        output_buffer += processed_line_content.encode('utf-8')
+                        output_buffer += b'\n'
+                        if len(output_buffer) >= 1 << 20:
+                            output_file.write(output_buffer)
+                            output_buffer.clear()
                     else:
                         # Optionally log if a line was removed
-                        logger.info(f"Skipping empty line {line_num} in {self.input_file_path}")
+                        empty_lines += 1
+                        if debug:
+                            logger.debug(f"Skipping empty line {line_num} in {self.input_file_path}")
 
+                output_file.write(output_buffer)
 
-            logger.info(f"Finished processing file: {self.input_file_path}")
+            logger.info(f"Finished processing file: {self.input_file_path} ({empty_lines} empty lines skipped)")
 
         except Exception as e:
             logger.error(f"Error processing text file {self.input_file_path}: {e}")
             raise
 
+# the news tail reuses TextCleaner's compiled patterns – only the punctuation filter differs (it also keeps quotation marks)
+_NEWS_NON_PUNCT_PATTERN = re.compile(r'[^\w\s\.\,\?\!\:\;\"\'_]')
+
+# re2 treats \s, \S, \d, \w, \b (and their negations) as ascii-only, so patterns using them have to stay on re
+_RE2_UNSAFE = re.compile(r'\\[sSdDwWbB]')
+
+@lru_cache(maxsize=None)
+def _ordered_unions(patterns: tuple) -> tuple:
+
+    # compiles a list of anchored patterns into (at most) two alternations: one on re2 for the patterns it can run
+    # with the same semantics (linear-time, no backtracking on the .*? runs), one on re for the rest
+    # each alternative is wrapped in a named group carrying its list index, so _first_match can tell which one won
+    # cached per process – the compiled unions never sit on the instance, which keeps it picklable for the worker pool
+
+    def union(engine, indexed_patterns):
+        return engine.compile('|'.join(f'(?P<p{i}>{pattern})' for i, pattern in indexed_patterns)) if indexed_patterns else None
+
+    re2_patterns = [(i, pattern) for i, pattern in enumerate(patterns) if not _RE2_UNSAFE.search(pattern)]
+    re_patterns = [(i, pattern) for i, pattern in enumerate(patterns) if _RE2_UNSAFE.search(pattern)]
+    return tuple(u for u in (union(re2, re2_patterns), union(re, re_patterns)) if u is not None)
+
+def _first_match(unions: tuple, text: str):
+
+    # match (at position 0) of the earliest pattern in list order across the unions, or None
+    # within a union, the alternation already prefers earlier patterns, so only the unions' winners need comparing
+
+    best, best_index = None, None
+    for union in unions:
+        match = union.match(text)
+        if match:
+            index = int(match.lastgroup[1:])
+            if best is None or index < best_index:
+                best, best_index = match, index
+    return best
+
+# NewsCleaner's pattern tables, compiled once at import and shared by all instances
+
+# Comprehensive emoji pattern (combining relevant ranges)
+_EMOJI_PATTERN = re.compile(
+    "["
+
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F700-\U0001F77F"  # alchemical symbols
+    "\U0001F780-\U0001F7FF"  # Geometric Shapes Extended
+    "\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
+    "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
+    "\U0001FA00-\U0001FA6F"  # Chess Symbols etc.
+    "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
+    "\U00002702-\U000027B0"  # Dingbats
+    "\U000024C2-\U0001F251"
+    "\U0001F1E6-\U0001F1FF"  # flags (iOS)
+    "\u2600-\u26FF"          # Misc symbols
+    "\u2700-\u27BF"          # Dingbats
+
+    "]+",
+    flags=re.UNICODE,
+)
+
+# ---- NEW: WHOLE LINE REMOVAL PATTERNS ----
+_WHOLE_LINE_PATTERNS = (
+    re.compile(r'^Last modified on *?2020$'),
+    re.compile(r'^Log in to update your newsletter preferences.*?Email already exists\.$'),
+    re.compile(r'^Sorry we cannot find that page.*?page could have gone missing\. Please click here for the homepage.*?top right hand corner of the page\.$'),
+    re.compile(r'^You already have an account\. Please log in.*?by email$'),
+    re.compile(r'^You will be connected to www\..*? in just a moment\.\.\.$'),
+    re.compile(r'^I would like to receive updates on cool openings and celebrity lifestyle news every week, by email$'),
+    re.compile(r'^Get YouTube without the ads$'),
+    re.compile(r'^We have detected that JavaScript is disabled in your browser\. Would you like to proceed to legacy Twitter$'),
+    re.compile(r'^Bloomberg Follow Bloomberg on LINE messenger.*?you need\.$'),
+    re.compile(r'^Your notification has been saved\. There was a problem saving your notification\.$'),
+    re.compile(r'^Email notifications are only sent once a day.*?new matching items\.$'),
+    re.compile(r'^Those born on this date are under the sign of \[\w+]\.$'),
+    re.compile(r'^We rely on advertising to help fund our award winning journalism\. We urge you to turn off your ad blocker.*?access our quality content in the future\.$'),
+    re.compile(r'^Thank you for your support\.$'),
+    re.compile(r'^The original source of this article is \[source, e\.g\. Global Research\] Comment on \[source\] Articles on our Facebook page$'),
+    re.compile(r'^The original source of this article is \[source]$'),
+    re.compile(r'^If you manage this site and have a question.*?contact NetFirms directly\.$'),
+    re.compile(r'^Thank you for visiting TruNews! The web browser you are using does not support modern websites\.$'),
+    re.compile(r'^G O Media may get a commission$'),
+    re.compile(r'^Live updates, tweets, photos, analysis and more from UFC.*?tap here\.$'),
+    re.compile(r'^Some clues have been edited for clarity\.$'),
+    re.compile(r'^The contents of this site are \d{4} Capitol Hill Publishing Corp\., a subsidiary of News Communications, Inc\.$'),
+    re.compile(r'^If you are not redirected in a few seconds, click here$'),
+    re.compile(r'^You can buy your own print of this cartoon$'),
+    re.compile(r'^Get a complete information picture of the day by subscribing to UNIAN news feeds\.$'),
+    re.compile(r'^For more information, please call:$'),
+    re.compile(r'^Join the conversation\. It gets feisty! Already have an account\?$'),
+    re.compile(r'^Log In$'),
+    re.compile(r'^Get involved with the news in your community$'),
+    re.compile(r'^Out of the ashes of censorship.*?VDARE\.com rises with the acquision.*?West Virginia\.$'),
+    re.compile(r'^Having a space where we can meet.*?it is hard to overstate\.$'),
+    re.compile(r'^And now, 100 mo donors will receive.*?Thank You Event at the Berkeley Castle\.$'),
+    re.compile(r'^VDARE\.com is celebrating it is 20th year in fighting to keep America American\. We are readying the castle\. And we want to see you there!$'),
+    re.compile(r'^Please enable JavaScript\. Without JavaScript some features of the site will not be accessible\.$'),
+    re.compile(r'^is legally registered in the UK as a company incorporated for charitable purposes\. Head Office: .*? International dialling: .*?$'),
+    re.compile(r'^This content is password protected\. To view it please enter your password below:$'),
+    re.compile(r'^Please show your Support\. Help keep us Online$'),
+    re.compile(r'^You can unlock this content, and much more, by becoming a subscriber\. Please follow the link below to get started\.$'),
+    re.compile(r'^SUBSCRIBE to ABC NEWS:.*?(?:http|https):\S+'),
+    re.compile(r'^Click to share on Facebook Opens in new window$'),
+    re.compile(r'^Success! Now check your email to confirm your subscription\.$'),
+    re.compile(r'^Share this on Facebook Opens in a new window$'),
+    re.compile(r'^OH YEAH, since we are not corporate or government owned help us out here\.$'),
+    re.compile(r'^YOU CAN ALSO SUPPORT US ON$'),
+    re.compile(r'^Click to email this to a friend Opens in new window$'),
+    re.compile(r'^Click to share on Twitter Opens in new window$'),
+    re.compile(r'^Here is a list of organizations where you can donate\.$'),
+    re.compile(r'^Welcome to WordPress\. This is your first post\. Edit or delete it, then start writing!$'),
+    re.compile(r'^By Dick Morris on May 11, 2020 Click Here to give me your thoughts and continue the discussion. Please forward this email to any friends or family who may be interested in viewing my video commentary!*? Dick Morris TV: Lunch Alert!$'),
+    re.compile(r'^!!!! View on YouTube$'),
+    re.compile(r'^That address is already in use Thanks for signing up$'),
+    re.compile(r'^\s*$'), # Blank lines
+    re.compile(r'^Sorry, your browser does not support iframes\.$'),
+)
+# all of the above as one alternation, so each line goes through a single fullmatch call instead of ~50
+# (fullmatch backtracks into the alternation, so it matches exactly when one of the patterns fullmatches)
+_WHOLE_LINE_PATTERN = re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in _WHOLE_LINE_PATTERNS))
+
+_PREFIX_REMOVAL_PATTERNS = (
+    # ---- NEW: High-priority, specific prefixes ----
+    # Match the highly specific Politico 'Editor Note' patterns
+    re.compile(r'^Editor Note: Morning (Defense|Education|Money) is a free version of POLITICO Pro (Defense|Education|Financial Services) morning newsletter.*?Act on the news with POLITICO Pro\.'),
+    re.compile(r'^Editor Note: As the world commemorates.*?The below piece is an answer to that question\. Please click here to see even more perspectives on this important topic\.'),
+    re.compile(r'^This post was originally published on this site'),
+    re.compile(r'^Programming announcement:*? Already a Pro subscriber\? Learn more here.'),
+    # Match the new President Trump patterns
+    re.compile(r'^President Trump Donald John TrumpREAD: The Hill interview.*?MORE'),
+    re.compile(r'^President Trump Donald John TrumpTrump administration calls.*?MORE'),
+    # Match new "Home [word]" and other specific prefixes
+    re.compile(r'^Home\s+(?:Breaking News|Criticism|Activism|Corruption|Culture)\s*'),
+    re.compile(r'^This is a video post\. See the videos below\.'),
+    re.compile(r'^A brief overview of the recent developments in \[.*?\]:'),
+    re.compile(r'^This is a rush transcript and may contain errors\. It will be updated\.'),
+    re.compile(r'^(?:UPDATE|BACKGROUND|PURPOSE|OBJECTIVE|INTRODUCTION|SCOPE|ANALYSIS|OPEN THREAD|BREAKING|OPINION|Reuters|Fox News|FILE PHOTO|By Dick Morris).*?(?: on .*?)?[:.]\s*'),
+    re.compile(r'^(?:The Virus|The Little Known Beginning|The Deadly Crisis|The Real Stakes).*?Dick Morris TV:(?: Lunch Alert| History Video)!'),
+    re.compile(r'^(?:WASHINGTON|NEW YORK|HONG KONG|VIENNA|STAUNTON|[A-Z\s,]+)\s*(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:,\s*\d{4})?\s*(?:\(or other locations, days and maybe June instead of may; but the location’s always all caps\))?'),
+    re.compile(r'^(?:ETH|NYP|CNBC|TheBlaze|CP|CBN|BIN|TMU|YOU\.S|U\.S)\s*'),
+    re.compile(r'^(?:By .*? on .*? Click Here to give me your thoughts and continue the discussion\.|Get all the latest news on coronavirus.*?Sign up here\.|Get breaking news alerts and special reports\..*?weekday mornings\.|The following is a transcript of an interview.*?Face the Nation.”|Slate is making its coronavirus coverage free for all readers\..*?Start your free trial\.|This article was contributed by.*?|This article was originally published by.*?|Stay tuned to Breitbart News for live updates\..*?All times eastern\.|My new book LOSERTHINK.*?|This is the Babylon Bee Interview Show\.|\[an interview title.*?\] appeared first on The Babylon Bee\.|: Urge your governor to reject.*?|: No to mandatory vaccination.*?|: Demand Planned Parenthood.*?|: Yes to reform\. No to riots revolution!|Tell Trump Christians cannot accept.*?|Click here if you are having trouble viewing the slideshow.*?|AMY GOODMAN: This is Democracy Now!,.*?|HOW TO MAKE MONEY ON AMAZON FREE eCOURSE:.*?|Preserve Your Investments W A Gold IRA.*?|Shield Yourself From Identity Theft! Click Here!.*?|Buy, Sell Exchange GOLD w a Mobile App! Click Here!.*?|Do not Get Caught In The Chaos Without Food! Click Here!.*?|Cristina Laila from The Gateway Pundit reports,|You can see Q posts aggregated live.*?http: www\.qanon\.pub|Click here to sign up|Borowitz Report|Here are the best shots from this week Advertiser and Shuttle Camera Club)'),
+
+    # ---- Group 1: Datelines and Timestamps (These are already specific) ----
+    re.compile(r'^[A-Z\s,]+,\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}\s*(?:\.\s*[A-Z]+\s*\.)?'),
+    re.compile(r'^(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:,)?\s*(?:\d{4})?\s*[A-Z][a-zA-Z]+'),
+    re.compile(r'^Last\s+Updated\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}[a-z]{2},\s+\d{4}\s+at\s+[\d\s:]+[ap]m'),
+    re.compile(r'^[A-Z\s]{5,}\s+[A-Z][a-zA-Z]+'),
+
+    # ---- Group 2 & 3: Refined Boilerplate, Calls to Action & Disclaimers ----
+    re.compile(r'^We will use your email address.*?Privacy Notice.*?data protection rights\.'),
+    re.compile(r'^BuzzFeed News has reporters.*?become a member.*?newsletter,\s+Outbreak Today\s*\.'),
+    re.compile(r'^Dear Reader:.*?Pandemic Pantry series.*?Enjoy!\s*'),
+    re.compile(r'^Here are some news stories.*?click the title above.*?products of the Fake News.*?(?:qanon\.pub|No Q\.)'),
+    re.compile(r'^This is a rush transcript\..*?(?:in its final form|It will be updated)\.'),
+    re.compile(r'^Sign up for our special edition newsletter to get a daily update on the coronavirus pandemic\.'),
+    re.compile(r'^Share on Facebook Share on Twitter Share on Pinterest'),
+    re.compile(r'^Please make sure these dispatches.*?Share with kin.*?do likewise\.'),
+    re.compile(r'^Click for more article by .*?\.\.'),
+    re.compile(r'^Editor note: This story originally was published by .*?\.$'),
+    re.compile(r'^The following video is brought to you courtesy of the .*?YouTube Channel\..*?watch it now\.'),
+    re.compile(r'^Written by .*? on \. Posted in Latest news'),
+
+    # ---- Group 4: Dynamic & Miscellaneous Boilerplate (Already specific) ----
+    re.compile(r'^The global death toll from the coronavirus is more than [\d,.]+,?\s*with more than [\d,.]+\s*million infections confirmed.*?respiratory illness\.'),
+    re.compile(r'^This Daily FRN News Brief is a summary of\s*'),
+    re.compile(r'^Here is the latest on coronavirus social distancing rules'),
+    re.compile(r'^Click to see the full size image'),
+    re.compile(r'^This is a video post\. See the video below\.'),
+    re.compile(r'^90 OF POLLS PROJECTED TO FALL IN THIS RANGE'),
+    re.compile(r'^(?:VT|CNN|COMMENT|PETITION|WATCH|NaturalHealth365)\s*'),
+)
+
+# ---- NEW: SUFFIX REMOVAL PATTERNS ----
+_SUFFIX_REMOVAL_PATTERNS = (
+    re.compile(r'Picture$'),
+    re.compile(r'The original source of this article is \[.*?\]$'),
+    re.compile(r'You can subscribe to \[name\] YouTube channel here\.$'),
+    re.compile(r'\[name\] for The New York Times$'),
+    re.compile(r'pic\.twitter\.com\s+\S+$'),
+    re.compile(r'To see more and join the club visit facebook\.com groups decameraclub$'),
+    re.compile(r'Get the latest updates here\.$'),
+    re.compile(r'Get the latest updates on COVID 19 here\.$'),
+    re.compile(r'Watch live below\.$'),
+    re.compile(r'Read more$'),
+    re.compile(r'See the report here: SUPPORT THE NETWORK WITH THE LINKS BELOW!.*?$'),
+    re.compile(r'Get exclusive content and watch full episodes now by downloading the Portable.TV app:.*?$'),
+    re.compile(r'SUBSCRIBE to our YouTube channel for more videos:.*?$'),
+    re.compile(r'ALSO AVAILABLE ON HULU: https: hulu\.tv \S+$'),
+    re.compile(r'To see more or to join click here$'),
+    re.compile(r'To find out more click here$'),
+    re.compile(r'and you can watch it below:$'),
+    re.compile(r'Please follow and like us:$'),
+    re.compile(r'Come and join us now at parler\.com davidicke$'),
+    re.compile(r'The video is on the link below:$'),
+    re.compile(r'The video can be seen below:$'),
+    re.compile(r'Thanks to \[name\] for this (link|video|image|photo)$'),
+)
+
+def _clean_news_tail(text: str, fix_contractions: bool) -> str:
+
+    # everything after prefix/suffix removal only depends on the line itself, so short lines are cached across files
+    # (ads, disclaimers and short syndicated pieces repeat between outlets and days, which the per-file dedup can't catch)
+    # full articles go through uncached, like _fix_contractions – caching those would pin hundreds of MB in every worker
+
+    if len(text) < _CONTRACTIONS_CACHE_MAX_LEN:
+        return _clean_news_tail_cached(text, fix_contractions)
+    return _clean_news_tail_uncached(text, fix_contractions)
+
+
+def _clean_news_tail_uncached(text: str, fix_contractions: bool) -> str:
+
+    if fix_contractions:
+        text = contractions.fix(text) # not _fix_contractions, short lines are already cached by _clean_news_tail
+
+    # Remove greater and less than symbols
+    text = _ANGLE_RUN_PATTERN.sub(' ', text) # remove sequences of > and <
+    
+    # Remove all underscores and hyphen types, incl. en-dash (–) and em-dash (—) (swap for whitespace)
+    text = text.translate(_DASH_TABLE)
+
+    # same guard as TextCleaner: with underscores gone through the dash table, none of these passes can match without an apostrophe
+    if "'" in text or '’' in text:
+        # Remove possessive suffixes
+        # Remove singular possessive
+        text = _SINGULAR_POSSESSIVE_PATTERN.sub(r"\1", text)
+        # Remove plural possessive, apostrophe followed by space, punctuation, or end of string
+        text = _PLURAL_POSSESSIVE_PATTERN.sub(r"\1", text)
+        # Remove random apostrophes surrounded by space (might help mitigate NER problems)
+        text = _LONE_APOSTROPHE_PATTERN.sub(' ', text)
+
+        # Final apostrophe rules
+        # Remove apostrophes prefixing or suffixing a word
+        text = _LEADING_APOSTROPHE_PATTERN.sub('', text)  # Remove apostrophe at start of a word boundary
+        text = _TRAILING_APOSTROPHE_PATTERN.sub('', text)  # Remove apostrophe at end of a word boundary
+        # Replace apostrophes inside words with underscore (consistent with NER strategy)
+        text = _INNER_APOSTROPHE_PATTERN.sub('_', text)
+
+        # Double check underscores
+        text = _UNDERSCORE_RUN_PATTERN.sub('_', text)
+        # Remove stray underscores surrounded by spaces (but not inside words)
+        text = _LONE_UNDERSCORE_PATTERN.sub(' ', text)
+
+        # Double check apostrophes (sanity)
+        text = _APOSTROPHE_PATTERN.sub(" ", text)
+
+    # Remove everything but normal punctualization (added: quotation marks)
+    text = _NEWS_NON_PUNCT_PATTERN.sub(' ', text)
+
+    # Repeated punctuation handling
+    # Replace any sequence of colons and semicolons surrounded by non-whitespace with a single space
+    text = _INNER_COLON_PATTERN.sub(' ', text)
+
+    # Final whitespace normalization
+    return _WHITESPACE_PATTERN.sub(' ', text).strip()
+
+_clean_news_tail_cached = lru_cache(maxsize=1 << 14)(_clean_news_tail_uncached)
+
+
 class NewsCleaner(FileFunction):
     # news version of the text cleaner, consistent with what was done to the podcasts
     # assumes both .txt input and output
@@ -563,171 +1291,22 @@ class NewsCleaner(FileFunction):
             logger.error(f"Contraction level must be 0 (no contraction expansion), 1 (using contractions) or 2 (using pycontractions), got {contraction_level}")
             raise ValueError(f"Contraction level must be between 0 and 2")
         
-        self.seen_line_hashes = set()
+        self.seen_line_hashes = set() # 64-bit ints, cheaper to hash/compare and store than hex strings
         self.FROM_RULE_CHAR_LIMIT = 200
         
-        # Comprehensive emoji pattern (combining relevant ranges)
-        self.EMOJI_PATTERN = re.compile(
-            "["
-
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F700-\U0001F77F"  # alchemical symbols
-            "\U0001F780-\U0001F7FF"  # Geometric Shapes Extended
-            "\U0001F800-\U0001F8FF"  # Supplemental Arrows-C
-            "\U0001F900-\U0001F9FF"  # Supplemental Symbols and Pictographs
-            "\U0001FA00-\U0001FA6F"  # Chess Symbols etc.
-            "\U0001FA70-\U0001FAFF"  # Symbols and Pictographs Extended-A
-            "\U00002702-\U000027B0"  # Dingbats
-            "\U000024C2-\U0001F251"
-            "\U0001F1E6-\U0001F1FF"  # flags (iOS)
-            "\u2600-\u26FF"          # Misc symbols
-            "\u2700-\u27BF"          # Dingbats
-
-            "]+",
-            flags=re.UNICODE,
-        )
-
-        # ---- NEW: WHOLE LINE REMOVAL PATTERNS ----
-        self.WHOLE_LINE_PATTERNS = [
-            re.compile(r'^Last modified on *?2020$'),
-            re.compile(r'^Log in to update your newsletter preferences.*?Email already exists\.$'),
-            re.compile(r'^Sorry we cannot find that page.*?page could have gone missing\. Please click here for the homepage.*?top right hand corner of the page\.$'),
-            re.compile(r'^You already have an account\. Please log in.*?by email$'),
-            re.compile(r'^You will be connected to www\..*? in just a moment\.\.\.$'),
-            re.compile(r'^I would like to receive updates on cool openings and celebrity lifestyle news every week, by email$'),
-            re.compile(r'^Get YouTube without the ads$'),
-            re.compile(r'^We have detected that JavaScript is disabled in your browser\. Would you like to proceed to legacy Twitter$'),
-            re.compile(r'^Bloomberg Follow Bloomberg on LINE messenger.*?you need\.$'),
-            re.compile(r'^Your notification has been saved\. There was a problem saving your notification\.$'),
-            re.compile(r'^Email notifications are only sent once a day.*?new matching items\.$'),
-            re.compile(r'^Those born on this date are under the sign of \[\w+]\.$'),
-            re.compile(r'^We rely on advertising to help fund our award winning journalism\. We urge you to turn off your ad blocker.*?access our quality content in the future\.$'),
-            re.compile(r'^Thank you for your support\.$'),
-            re.compile(r'^The original source of this article is \[source, e\.g\. Global Research\] Comment on \[source\] Articles on our Facebook page$'),
-            re.compile(r'^The original source of this article is \[source]$'),
-            re.compile(r'^If you manage this site and have a question.*?contact NetFirms directly\.$'),
-            re.compile(r'^Thank you for visiting TruNews! The web browser you are using does not support modern websites\.$'),
-            re.compile(r'^G O Media may get a commission$'),
-            re.compile(r'^Live updates, tweets, photos, analysis and more from UFC.*?tap here\.$'),
-            re.compile(r'^Some clues have been edited for clarity\.$'),
-            re.compile(r'^The contents of this site are \d{4} Capitol Hill Publishing Corp\., a subsidiary of News Communications, Inc\.$'),
-            re.compile(r'^If you are not redirected in a few seconds, click here$'),
-            re.compile(r'^You can buy your own print of this cartoon$'),
-            re.compile(r'^Get a complete information picture of the day by subscribing to UNIAN news feeds\.$'),
-            re.compile(r'^For more information, please call:$'),
-            re.compile(r'^Join the conversation\. It gets feisty! Already have an account\?$'),
-            re.compile(r'^Log In$'),
-            re.compile(r'^Get involved with the news in your community$'),
-            re.compile(r'^Out of the ashes of censorship.*?VDARE\.com rises with the acquision.*?West Virginia\.$'),
-            re.compile(r'^Having a space where we can meet.*?it is hard to overstate\.$'),
-            re.compile(r'^And now, 100 mo donors will receive.*?Thank You Event at the Berkeley Castle\.$'),
-            re.compile(r'^VDARE\.com is celebrating it is 20th year in fighting to keep America American\. We are readying the castle\. And we want to see you there!$'),
-            re.compile(r'^Please enable JavaScript\. Without JavaScript some features of the site will not be accessible\.$'),
-            re.compile(r'^is legally registered in the UK as a company incorporated for charitable purposes\. Head Office: .*? International dialling: .*?$'),
-            re.compile(r'^This content is password protected\. To view it please enter your password below:$'),
-            re.compile(r'^Please show your Support\. Help keep us Online$'),
-            re.compile(r'^You can unlock this content, and much more, by becoming a subscriber\. Please follow the link below to get started\.$'),
-            re.compile(r'^SUBSCRIBE to ABC NEWS:.*?(?:http|https):\S+'),
-            re.compile(r'^Click to share on Facebook Opens in new window$'),
-            re.compile(r'^Success! Now check your email to confirm your subscription\.$'),
-            re.compile(r'^Share this on Facebook Opens in a new window$'),
-            re.compile(r'^OH YEAH, since we are not corporate or government owned help us out here\.$'),
-            re.compile(r'^YOU CAN ALSO SUPPORT US ON$'),
-            re.compile(r'^Click to email this to a friend Opens in new window$'),
-            re.compile(r'^Click to share on Twitter Opens in new window$'),
-            re.compile(r'^Here is a list of organizations where you can donate\.$'),
-            re.compile(r'^Welcome to WordPress\. This is your first post\. Edit or delete it, then start writing!$'),
-            re.compile(r'^By Dick Morris on May 11, 2020 Click Here to give me your thoughts and continue the discussion. Please forward this email to any friends or family who may be interested in viewing my video commentary!*? Dick Morris TV: Lunch Alert!$'),
-            re.compile(r'^!!!! View on YouTube$'),
-            re.compile(r'^That address is already in use Thanks for signing up$'),
-            re.compile(r'^\s*$'), # Blank lines
-            re.compile(r'^Sorry, your browser does not support iframes\.$'),
-        ]
-
-        self.PREFIX_REMOVAL_PATTERNS = [
-            # ---- NEW: High-priority, specific prefixes ----
-            # Match the highly specific Politico 'Editor Note' patterns
-            re.compile(r'^Editor Note: Morning (Defense|Education|Money) is a free version of POLITICO Pro (Defense|Education|Financial Services) morning newsletter.*?Act on the news with POLITICO Pro\.'),
-            re.compile(r'^Editor Note: As the world commemorates.*?The below piece is an answer to that question\. Please click here to see even more perspectives on this important topic\.'),
-            re.compile(r'^This post was originally published on this site'),
-            re.compile(r'^Programming announcement:*? Already a Pro subscriber\? Learn more here.'),
-            # Match the new President Trump patterns
-            re.compile(r'^President Trump Donald John TrumpREAD: The Hill interview.*?MORE'),
-            re.compile(r'^President Trump Donald John TrumpTrump administration calls.*?MORE'),
-            # Match new "Home [word]" and other specific prefixes
-            re.compile(r'^Home\s+(?:Breaking News|Criticism|Activism|Corruption|Culture)\s*'),
-            re.compile(r'^This is a video post\. See the videos below\.'),
-            re.compile(r'^A brief overview of the recent developments in \[.*?\]:'),
-            re.compile(r'^This is a rush transcript and may contain errors\. It will be updated\.'),
-            re.compile(r'^(?:UPDATE|BACKGROUND|PURPOSE|OBJECTIVE|INTRODUCTION|SCOPE|ANALYSIS|OPEN THREAD|BREAKING|OPINION|Reuters|Fox News|FILE PHOTO|By Dick Morris).*?(?: on .*?)?[:.]\s*'),
-            re.compile(r'^(?:The Virus|The Little Known Beginning|The Deadly Crisis|The Real Stakes).*?Dick Morris TV:(?: Lunch Alert| History Video)!'),
-            re.compile(r'^(?:WASHINGTON|NEW YORK|HONG KONG|VIENNA|STAUNTON|[A-Z\s,]+)\s*(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:,\s*\d{4})?\s*(?:\(or other locations, days and maybe June instead of may; but the location’s always all caps\))?'),
-            re.compile(r'^(?:ETH|NYP|CNBC|TheBlaze|CP|CBN|BIN|TMU|YOU\.S|U\.S)\s*'),
-            re.compile(r'^(?:By .*? on .*? Click Here to give me your thoughts and continue the discussion\.|Get all the latest news on coronavirus.*?Sign up here\.|Get breaking news alerts and special reports\..*?weekday mornings\.|The following is a transcript of an interview.*?Face the Nation.”|Slate is making its coronavirus coverage free for all readers\..*?Start your free trial\.|This article was contributed by.*?|This article was originally published by.*?|Stay tuned to Breitbart News for live updates\..*?All times eastern\.|My new book LOSERTHINK.*?|This is the Babylon Bee Interview Show\.|\[an interview title.*?\] appeared first on The Babylon Bee\.|: Urge your governor to reject.*?|: No to mandatory vaccination.*?|: Demand Planned Parenthood.*?|: Yes to reform\. No to riots revolution!|Tell Trump Christians cannot accept.*?|Click here if you are having trouble viewing the slideshow.*?|AMY GOODMAN: This is Democracy Now!,.*?|HOW TO MAKE MONEY ON AMAZON FREE eCOURSE:.*?|Preserve Your Investments W A Gold IRA.*?|Shield Yourself From Identity Theft! Click Here!.*?|Buy, Sell Exchange GOLD w a Mobile App! Click Here!.*?|Do not Get Caught In The Chaos Without Food! Click Here!.*?|Cristina Laila from The Gateway Pundit reports,|You can see Q posts aggregated live.*?http: www\.qanon\.pub|Click here to sign up|Borowitz Report|Here are the best shots from this week Advertiser and Shuttle Camera Club)'),
-
-            # ---- Group 1: Datelines and Timestamps (These are already specific) ----
-            re.compile(r'^[A-Z\s,]+,\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}\s*(?:\.\s*[A-Z]+\s*\.)?'),
-            re.compile(r'^(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}(?:,)?\s*(?:\d{4})?\s*[A-Z][a-zA-Z]+'),
-            re.compile(r'^Last\s+Updated\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2}[a-z]{2},\s+\d{4}\s+at\s+[\d\s:]+[ap]m'),
-            re.compile(r'^[A-Z\s]{5,}\s+[A-Z][a-zA-Z]+'),
-
-            # ---- Group 2 & 3: Refined Boilerplate, Calls to Action & Disclaimers ----
-            re.compile(r'^We will use your email address.*?Privacy Notice.*?data protection rights\.'),
-            re.compile(r'^BuzzFeed News has reporters.*?become a member.*?newsletter,\s+Outbreak Today\s*\.'),
-            re.compile(r'^Dear Reader:.*?Pandemic Pantry series.*?Enjoy!\s*'),
-            re.compile(r'^Here are some news stories.*?click the title above.*?products of the Fake News.*?(?:qanon\.pub|No Q\.)'),
-            re.compile(r'^This is a rush transcript\..*?(?:in its final form|It will be updated)\.'),
-            re.compile(r'^Sign up for our special edition newsletter to get a daily update on the coronavirus pandemic\.'),
-            re.compile(r'^Share on Facebook Share on Twitter Share on Pinterest'),
-            re.compile(r'^Please make sure these dispatches.*?Share with kin.*?do likewise\.'),
-            re.compile(r'^Click for more article by .*?\.\.'),
-            re.compile(r'^Editor note: This story originally was published by .*?\.$'),
-            re.compile(r'^The following video is brought to you courtesy of the .*?YouTube Channel\..*?watch it now\.'),
-            re.compile(r'^Written by .*? on \. Posted in Latest news'),
-
-            # ---- Group 4: Dynamic & Miscellaneous Boilerplate (Already specific) ----
-            re.compile(r'^The global death toll from the coronavirus is more than [\d,.]+,?\s*with more than [\d,.]+\s*million infections confirmed.*?respiratory illness\.'),
-            re.compile(r'^This Daily FRN News Brief is a summary of\s*'),
-            re.compile(r'^Here is the latest on coronavirus social distancing rules'),
-            re.compile(r'^Click to see the full size image'),
-            re.compile(r'^This is a video post\. See the video below\.'),
-            re.compile(r'^90 OF POLLS PROJECTED TO FALL IN THIS RANGE'),
-            re.compile(r'^(?:VT|CNN|COMMENT|PETITION|WATCH|NaturalHealth365)\s*'),
-        ]
-
-        # ---- NEW: SUFFIX REMOVAL PATTERNS ----
-        self.SUFFIX_REMOVAL_PATTERNS = [
-            re.compile(r'Picture$'),
-            re.compile(r'The original source of this article is \[.*?\]$'),
-            re.compile(r'You can subscribe to \[name\] YouTube channel here\.$'),
-            re.compile(r'\[name\] for The New York Times$'),
-            re.compile(r'pic\.twitter\.com\s+\S+$'),
-            re.compile(r'To see more and join the club visit facebook\.com groups decameraclub$'),
-            re.compile(r'Get the latest updates here\.$'),
-            re.compile(r'Get the latest updates on COVID 19 here\.$'),
-            re.compile(r'Watch live below\.$'),
-            re.compile(r'Read more$'),
-            re.compile(r'See the report here: SUPPORT THE NETWORK WITH THE LINKS BELOW!.*?$'),
-            re.compile(r'Get exclusive content and watch full episodes now by downloading the Portable.TV app:.*?$'),
-            re.compile(r'SUBSCRIBE to our YouTube channel for more videos:.*?$'),
-            re.compile(r'ALSO AVAILABLE ON HULU: https: hulu\.tv \S+$'),
-            re.compile(r'To see more or to join click here$'),
-            re.compile(r'To find out more click here$'),
-            re.compile(r'and you can watch it below:$'),
-            re.compile(r'Please follow and like us:$'),
-            re.compile(r'Come and join us now at parler\.com davidicke$'),
-            re.compile(r'The video is on the link below:$'),
-            re.compile(r'The video can be seen below:$'),
-            re.compile(r'Thanks to \[name\] for this (link|video|image|photo)$'),
-        ]
+        # pattern tables live at module level (compiled once at import), the instance only keeps references
+        self.EMOJI_PATTERN = _EMOJI_PATTERN
+        self.WHOLE_LINE_PATTERNS = _WHOLE_LINE_PATTERNS
+        self.WHOLE_LINE_PATTERN = _WHOLE_LINE_PATTERN
+        self.PREFIX_REMOVAL_PATTERNS = _PREFIX_REMOVAL_PATTERNS
+        self.SUFFIX_REMOVAL_PATTERNS = _SUFFIX_REMOVAL_PATTERNS
 
 
     def remove_emojis(self, text: str) -> str:
-        text_no_emoji = self.EMOJI_PATTERN.sub(' ', text)
+        if not text.isascii(): # every emoji range is outside ascii, so most lines can skip the big char class
+            text = self.EMOJI_PATTERN.sub(' ', text)
         # Normalize whitespace to single spaces and strip leading/trailing spaces
-        return re.sub(r'\s+', ' ', text_no_emoji).strip()
+        return _WHITESPACE_PATTERN.sub(' ', text).strip()
 
     def map(self) -> None:
 
@@ -735,15 +1314,29 @@ class NewsCleaner(FileFunction):
             logger.info(f"Processing text file: {self.input_file_path}")
 
             self.seen_line_hashes.clear() # to avoid deduplicating across files
-            with open(self.input_file_path, 'r', encoding='utf-8') as input_file, \
-                 open(self.output_file_path, 'w', encoding='utf-8') as output_file:
+            prefix_unions = _ordered_unions(tuple(pattern.pattern for pattern in self.PREFIX_REMOVAL_PATTERNS))
+            suffix_unions = _ordered_unions(tuple(pattern.pattern for pattern in self.SUFFIX_REMOVAL_PATTERNS))
+
+            # per-line events are counted and summarized once per file, only logged line by line at debug level
+            debug = logger.isEnabledFor(logging.DEBUG)
+            duplicates = whole_lines = prefixes = from_rule = suffixes = empty_lines = 0
+            with open(self.input_file_path, 'r', encoding='utf-8', buffering=1 << 20) as input_file, \
+                 open(self.output_file_path, 'wb') as output_file:
+
+                output_buffer = bytearray() # flushed to disk in ~1MB blocks, like TextCleaner
 
                 for line_num, line in enumerate(input_file, 1): # Process line by line
-                    
-                    line_hash = xxhash.xxh64(line.strip().encode('utf-8')).hexdigest()
+
+                    stripped_line = line.strip()
+                    if not stripped_line: # blank/whitespace-only lines can't produce output, skip them before any regex work
+                        continue
+
+                    line_hash = xxhash.xxh3_64_intdigest(stripped_line.encode('utf-8'))
 
                     if line_hash in self.seen_line_hashes:
-                        logger.info(f"Duplicate line {line_num} found, skipping.")
+                        duplicates += 1
+                        if debug:
+                            logger.debug(f"Duplicate line {line_num} found, skipping.")
                         continue # skip to the next line
                     
                     self.seen_line_hashes.add(line_hash)
@@ -752,27 +1345,26 @@ class NewsCleaner(FileFunction):
                     processed_line_content = line.rstrip('\n')
 
                     # ---- NEW: Whole Line Removal Logic ----
-                    is_whole_line_match = False
-                    for pattern in self.WHOLE_LINE_PATTERNS:
-                        if pattern.fullmatch(processed_line_content):
-                            logger.info(f"Removed whole line {line_num} due to boilerplate match.")
-                            is_whole_line_match = True
-                            break
-                    if is_whole_line_match:
+                    if self.WHOLE_LINE_PATTERN.fullmatch(processed_line_content):
+                        whole_lines += 1
+                        if debug:
+                            logger.debug(f"Removed whole line {line_num} due to boilerplate match.")
                         continue # Discard the line and move to the next
 
                     # ---- Prefix Removal Logic ----
-                    prefix_removed = False
-                    for pattern in self.PREFIX_REMOVAL_PATTERNS:
-                        if pattern.match(processed_line_content):
-                            processed_line_content = pattern.sub('', processed_line_content, count=1).lstrip()
-                            logger.info(f"Removed prefix from line {line_num}.")
-                            prefix_removed = True
-                            break # Stop checking other patterns for this line
+                    prefix_match = _first_match(prefix_unions, processed_line_content)
+                    prefix_removed = prefix_match is not None
+                    if prefix_removed:
+                        processed_line_content = processed_line_content[prefix_match.end():].lstrip() # cut the matched prefix
+                        prefixes += 1
+                        if debug:
+                            logger.debug(f"Removed prefix from line {line_num}.")
                     
                     # Handle the special 'from' rule only if no other prefix was removed
                     if not prefix_removed and processed_line_content.startswith('from ') and len(processed_line_content) < self.FROM_RULE_CHAR_LIMIT:
-                        logger.info(f"Line {line_num} removed by 'from' rule.")
+                        from_rule += 1
+                        if debug:
+                            logger.debug(f"Line {line_num} removed by 'from' rule.")
                         processed_line_content = '' # Discard the line completely
 
                     # If the line is now empty after all prefix removals, skip it
@@ -780,71 +1372,42 @@ class NewsCleaner(FileFunction):
                         continue
                     
                     # ---- NEW: Suffix Removal Logic ----
-                    for pattern in self.SUFFIX_REMOVAL_PATTERNS:
-                        if pattern.search(processed_line_content):
-                            processed_line_content = pattern.sub('', processed_line_content, count=1).rstrip()
-                            logger.info(f"Removed suffix from line {line_num}.")
-                            break # Stop checking other patterns for this line
-
-                    processed_line_content = re.sub('•', '. ', processed_line_content)
+                    # the unions only tell whether any suffix matches (one search instead of 22 for almost every line)
+                    # they can't replace the loop: a union finds the leftmost match, but the first pattern in list order has to win
+                    if any(union.search(processed_line_content) for union in suffix_unions):
+                        for pattern in self.SUFFIX_REMOVAL_PATTERNS:
+                            if pattern.search(processed_line_content):
+                                processed_line_content = pattern.sub('', processed_line_content, count=1).rstrip()
+                                suffixes += 1
+                                if debug:
+                                    logger.debug(f"Removed suffix from line {line_num}.")
+                                break # Stop checking other patterns for this line
+
+                    processed_line_content = processed_line_content.replace('•', '. ') # plain substring, no regex needed
                     processed_line_content = self.remove_emojis(processed_line_content)
 
-                    if self.contraction_level == 1:
-                        processed_line_content = contractions.fix(processed_line_content)
-                    elif self.contraction_level == 2:
+                    if self.contraction_level == 2:
                         logger.error("'contraction_level == 2' hasn't been implemented yet.")
                         raise NotImplementedError("'contraction_level == 2' hasn't been implemented yet.")
-                    
-                    # Remove greater and less than symbols
-                    processed_line_content = re.sub(r'>+', ' ', processed_line_content) # remove sequences of >
-                    processed_line_content = re.sub(r'<+', ' ', processed_line_content) # remove sequences of <
-                    
-                    # Remove all underscores (swap for whitespace)
-                    processed_line_content = processed_line_content.replace('_', ' ')
-                    
-                    # Remove all hyphen types (swap for spaces)
-                    processed_line_content = processed_line_content.replace('-', ' ')
-                    processed_line_content = re.sub(r'[–—]', ' ', processed_line_content)  # en-dash (–), em-dash (—)
-
-                    # Remove possessive suffixes
-                    # Remove singular possessive
-                    processed_line_content = re.sub(r"\b(\w+)[’']s\b", r"\1", processed_line_content)
-                    # Remove plural possessive, apostrophe followed by space, punctuation, or end of string
-                    processed_line_content = re.sub(r"\b(\w+s)[’'](?=\s|$|[.,;:!?—…‘’“”\"\'\-\)])", r"\1", processed_line_content)
-                    # Remove random apostrophes surrounded by space (might help mitigate NER problems)
-                    processed_line_content = re.sub(r'(?<=\s)[\'’](?=\s)', ' ', processed_line_content)
-
-                    # Final apostrophe rules
-                    # Remove apostrophes prefixing or suffixing a word
-                    processed_line_content = re.sub(r"\b[’']\s+", '', processed_line_content)  # Remove apostrophe at start of a word boundary
-                    processed_line_content = re.sub(r"\s+[’']\b", '', processed_line_content)  # Remove apostrophe at end of a word boundary
-                    # Replace apostrophes inside words with underscore (consistent with NER strategy)
-                    processed_line_content = re.sub(r"(?<=\w)[’'](?=\w)", '_', processed_line_content)
-
-                    # Double check underscores
-                    processed_line_content = re.sub(r'_+', '_', processed_line_content)
-                    # Remove stray underscores surrounded by spaces (but not inside words)
-                    processed_line_content = re.sub(r'(?<=\s)_+(?=\s)', ' ', processed_line_content)
-
-                    # Double check apostrophes (sanity)
-                    processed_line_content = re.sub(r"[’']", " ", processed_line_content)
-
-                    # Remove everything but normal punctualization (added: quotation marks)
-                    processed_line_content = re.sub(r'[^\w\s\.\,\?\!\:\;\"\'_]', ' ', processed_line_content)
 
-                    # Repeated punctuation handling
-                    # Replace any sequence of colons and semicolons surrounded by non-whitespace with a single space
-                    processed_line_content = re.sub(r'(?<=\S)[;:]+(?=\S)', ' ', processed_line_content)
-
-                    # Final whitespace normalization
-                    processed_line_content = re.sub(r'\s+', ' ', processed_line_content).strip()
+                    processed_line_content = _clean_news_tail(processed_line_content, self.contraction_level == 1)
 
                     if processed_line_content: # Only write if there's actual content
-                        output_file.write(processed_line_content + '\n')
+                        output_buffer += processed_line_content.encode('utf-8')
+                        output_buffer += b'\n'
+                        if len(output_buffer) >= 1 << 20:
+                            output_file.write(output_buffer)
+                            output_buffer.clear()
                     else:
-                        logger.info(f"Skipping empty line {line_num} in {self.input_file_path}")
+                        empty_lines += 1
+                        if debug:
+                            logger.debug(f"Skipping empty line {line_num} in {self.input_file_path}")
 
-            logger.info(f"Finished processing file: {self.input_file_path}")
+                output_file.write(output_buffer)
+
+            logger.info(f"Finished processing file: {self.input_file_path} "
+                        f"(skipped {duplicates} duplicates, {whole_lines} boilerplate lines, {from_rule} 'from' lines, {empty_lines} empty lines; "
+                        f"removed {prefixes} prefixes, {suffixes} suffixes)")
 
         except Exception as e:
             logger.error(f"Error processing text file {self.input_file_path}: {e}")
@@ -868,23 +1431,35 @@ class StopTokenAppender(FileFunction):
 
         self.stop_token = stop_token # please let this work
 
+        # the stop token is fixed for the whole file, so build both line endings once
+        self._suffix_no_dot = f" {stop_token}\n".encode('utf-8')
+        self._suffix_with_dot = f". {stop_token}\n".encode('utf-8')
+
 
     def map(self): 
         
         try: 
-            with open(self.input_file_path, 'r', encoding='utf-8') as input_file, open(self.output_file_path, 'w', encoding='utf-8') as output_file:
+            suffix_no_dot = self._suffix_no_dot
+            suffix_with_dot = self._suffix_with_dot
+
+            with open(self.input_file_path, 'rb') as input_file, open(self.output_file_path, 'wb') as output_file:
 
-                for line in input_file:
+                output_buffer = bytearray() # flushed to disk in ~1MB blocks
+
+                for line in _iter_mmap_lines(input_file): # same mmap line splitting as TextCleaner
                     
                     cleaned_line_content = line.strip()
-                    if not (cleaned_line_content.endswith('.') or 
-                            cleaned_line_content.endswith('!') or 
-                            cleaned_line_content.endswith('?')):
-                        cleaned_line_content += '.'
+                    output_buffer += cleaned_line_content
+                    if cleaned_line_content[-1:] in (b'.', b'!', b'?'): # one slice compare instead of three endswith calls
+                        output_buffer += suffix_no_dot
+                    else:
+                        output_buffer += suffix_with_dot
 
-                    modified_line = f"{cleaned_line_content} {self.stop_token}\n"
-                    
-                    output_file.write(modified_line)
+                    if len(output_buffer) >= 1 << 20:
+                        output_file.write(output_buffer)
+                        output_buffer.clear()
+
+                output_file.write(output_buffer)
 
         except Exception as e:
             logger.error(f"Error processing text file: {e}")
@@ -894,12 +1469,18 @@ class StopTokenAppender(FileFunction):
 class GloVeFormatter(FileFunction):
 
     # expects a json file containing word2vec-formatted sentence lists and outputs a text file
+    # (or a .jsonl file with one sentence list per line, see SentenceListCreator's output_extension)
 
     def __init__(self,
-                 stop_token: List[str] = ["i", "love", "blueberry", "waffles"]
+                 stop_token: List[str] = ["i", "love", "blueberry", "waffles"],
+                 input_extension: str = ".json"
                 ) -> None:
         
-        self.input_extension = ".json"
+        if input_extension not in [".json", ".jsonl"]:
+            logger.error(f"Invalid input extension: {input_extension}")
+            raise TypeError("Input must be .json or .jsonl file.")
+
+        self.input_extension = input_extension
         self.output_extension = ".txt"
 
         super().__init__(
@@ -915,18 +1496,52 @@ class GloVeFormatter(FileFunction):
         try: 
             logger.info(f"Processing json file: {self.input_file_path}")
 
-            with open(self.input_file_path, 'r', encoding='utf-8') as input_file, open(self.output_file_path, 'w', encoding='utf-8') as output_file:
-            
-                data = json.load(input_file)  # load json (should be a list of lists)
+            # binary output with a big buffer – each sentence is encoded once, skipping the TextIOWrapper encoder
+            with open(self.input_file_path, 'rb', buffering=1 << 20) as input_file, open(self.output_file_path, 'wb', buffering=1 << 20) as output_file:
 
-                if not isinstance(data, list) or not all(isinstance(sentence, list) for sentence in data):
-                    raise ValueError("json file must contain a list of lists (tokenized sentences).")
+                if self.input_extension == ".jsonl":
+                    # one sentence list per line, no incremental parser needed
+                    data = (orjson.loads(line) for line in input_file if not line.isspace())
+                else:
+                    # stream the sentences one at a time (same peek as EntrySimplifier) instead of json.load-ing the whole corpus
+                    events = ijson.parse(input_file, buf_size=1 << 20) # ijson reads 64KB at a time by default
+                    try:
+                        first_event = next(events, ('', None, None))
+                    except ijson.JSONError as e:
+                        logger.error(f"Failed to parse JSON: {e}")
+                        raise
+
+                    if first_event[1] != 'start_array':
+                        raise ValueError("json file must contain a list of lists (tokenized sentences).")
+
+                    data = ijson.items(chain([first_event], events), 'item')
 
-                for sentence in data:
-                    if sentence == self.stop_token:  # skip sentinels
-                        output_file.write("\n")  # add newline
+                parts = [] # output pieces, joined and written in ~4MB blocks instead of one write per sentence
+                parts_size = 0
+
+                # bind everything the loop touches to locals (saves an attribute/global lookup per sentence)
+                stop_token = self.stop_token
+                join = " ".join
+                append = parts.append
+
+                for i, sentence in enumerate(data):
+                    if not isinstance(sentence, list): # checked here so the list is only walked once
+                        raise ValueError(f"json file must contain a list of lists (tokenized sentences), got {type(sentence).__name__} at index {i}.")
+
+                    if sentence == stop_token:  # skip sentinels
+                        append(b"\n")  # add newline
+                        parts_size += 1
                     elif sentence: # safety, not really needed
-                        output_file.write(" ".join(sentence) + " ")  # write words as a space-separated line
+                        encoded = join(sentence).encode('utf-8') + b" "  # write words as a space-separated line
+                        append(encoded)
+                        parts_size += len(encoded)
+
+                    if parts_size >= 4 << 20:
+                        output_file.write(b"".join(parts))
+                        parts.clear()
+                        parts_size = 0
+
+                output_file.write(b"".join(parts))
         
                 logger.info(f"Finished processing. Output saved to: {self.output_file_path}")
         
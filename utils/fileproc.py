@@ -3,8 +3,12 @@ import shutil
 import logging
 from typing import List, Optional, Union, Tuple, TypeVar
 import re
+import os
+import copy
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-from utils.filefunc import FileFunction
+from utils.filefunc import FileFunction, _available_cpus
 
 # set up logging
 logging.basicConfig(
@@ -16,6 +20,57 @@ logger = logging.getLogger("FileProcessor")
 # create new type for FileFunction
 T = TypeVar('T', bound=FileFunction)
 
+# the number at the end of an input file's stem (e.g. podcast12 -> 12), carried over to the output file name
+_TRAILING_DIGITS_PATTERN = re.compile(r'(\d+)$')
+
+
+def _existing_files(paths: List[Path]) -> set:
+
+    # returns the paths that exist, listing each parent directory once instead of stat-ing every file
+    # (one readdir pass per directory is a lot cheaper than thousands of stats, especially on network filesystems)
+
+    by_parent = {}
+    for path in paths:
+        by_parent.setdefault(path.parent, []).append(path)
+
+    existing = set()
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                existing.update(parent / entry.name for entry in entries)
+        except FileNotFoundError:
+            continue # nothing in a missing directory exists
+        except OSError:
+            existing.update(path for path in children if path.exists()) # can't list it (e.g. no read permission), stat instead
+    return existing
+
+
+def _apply_function(function: FileFunction, input_path: Path, output_path: Path) -> Path:
+
+    # runs a single file through a function (top-level so it can be pickled into worker processes)
+    # each worker gets its own copy of the function, so per-file state isn't shared
+    # assumes process_files already checked that the input exists
+
+    function.input_file_path = input_path
+    function.output_file_path = output_path
+
+    logger.info(f"Processing file {input_path} with function: {function.__class__.__name__}")
+    return function.apply() # returns function.output_file_path
+
+
+# worker-side copy of the function, set once per worker by the pool initializer
+# (instead of pickling the function along with every single file)
+# thread-local, so it works for both pools: process workers run their tasks on the thread that ran the initializer
+_worker = threading.local()
+
+def _init_worker(function: FileFunction, copy_function: bool = False) -> None:
+    # threads share the caller's object, so they each take a copy (the functions keep per-file state on self)
+    _worker.function = copy.deepcopy(function) if copy_function else function
+
+def _apply_worker_function(input_path: Path, output_path: Path) -> Path:
+    return _apply_function(_worker.function, input_path, output_path)
+
+
 class FileProcessor:
 
     # wrapper class for FileFunctions
@@ -25,19 +80,25 @@ class FileProcessor:
                  input_file_path_list: List[Union[str, Path]], 
                  function: FileFunction, 
                  destination: Union[str, Path] = Path(__file__).resolve().parent,
-                 output_prefix: str = None
+                 output_prefix: str = None,
+                 n_workers: Optional[int] = 1, # files processed in parallel, None uses all cores this process may run on
+                 executor: str = "process" # "thread" for i/o-bound functions (e.g. the default copy), "process" for the cleaners/spacy
                  # maybe add some renaming options
                  ) -> None:
         
-        self.input_file_path_list = []
-        for input_file_path in input_file_path_list:
-            path = Path(input_file_path) if isinstance(input_file_path, str) else input_file_path
-            self.input_file_path_list.append(path)
+        self.input_file_path_list = [Path(input_file_path) if isinstance(input_file_path, str) else input_file_path
+                                     for input_file_path in input_file_path_list]
 
         self.function = function
         self.destination = Path(destination) if isinstance(destination, str) else destination
         self.output_prefix = output_prefix
         self.output_file_path_list = []
+        self.n_workers = n_workers if n_workers is not None else _available_cpus() # respects slurm's cpu allocation
+
+        if executor not in ["process", "thread"]:
+            logger.error(f"Invalid executor: {executor}")
+            raise ValueError("executor must be 'process' or 'thread'.")
+        self.executor = executor
 
     def generate_output_file_paths(self) -> None:
 
@@ -50,18 +111,25 @@ class FileProcessor:
 
         logger.info(f"Generating output paths for {len(self.input_file_path_list)} files to {self.destination}")
 
+        # constant for the whole batch
+        output_prefix = self.output_prefix
+        output_extension = self.function.output_extension
+        destination = self.destination
+        append = self.output_file_path_list.append
+        search_trailing_digits = _TRAILING_DIGITS_PATTERN.search
+
         for input_path in self.input_file_path_list:
             
             # generate new filename
 
-            match = re.search(r'(\d+)$', input_path.stem)
-            suffix = match.group(1) if match else input_path.stem  # fallback in case no match
+            stem = input_path.stem
+            match = search_trailing_digits(stem)
+            suffix = match.group(1) if match else stem  # fallback in case no match
 
-            new_filename = f"{self.output_prefix}{suffix}{self.function.output_extension}"
-            output_path = self.destination / new_filename
+            output_path = destination / f"{output_prefix}{suffix}{output_extension}"
 
             logger.debug(f"Generated output path: {output_path} for input: {input_path}")
-            self.output_file_path_list.append(output_path)
+            append(output_path)
 
         logger.info(f"Successfully generated {len(self.output_file_path_list)} output file paths")
 
@@ -94,27 +162,53 @@ class FileProcessor:
 
         logger.info(f"Starting to process {len(self.input_file_path_list)} files")
 
-        for i, input_path in enumerate(self.input_file_path_list):
-            try: 
-                if not input_path.exists(): # maybe move this to the constructor
-                    logger.error(f"File does not exist: {input_path}")
-                    raise FileNotFoundError(f"File not found: {input_path}")
-                
-                # set input and output paths for function
-                self.function.input_file_path = input_path
-                self.function.output_file_path = self.output_file_path_list[i]
-                
-                # apply function
-                logger.info(f"Processing file {input_path} with function: {self.function.__class__.__name__}")
-                log_path = self.function.apply() # returns self.function.output_file_path
-                logger.info(f"File processed at destination: {log_path}")
-                
-                processed_count += 1
-
-            except Exception as e:
-                logger.error(f"Error processing {input_path}: {e}")
+        # check all inputs up front, missing ones count as errors and aren't handed to the function
+        existing = _existing_files(self.input_file_path_list)
+        jobs = []
+        for input_path, output_path in zip(self.input_file_path_list, self.output_file_path_list):
+            if input_path in existing:
+                jobs.append((input_path, output_path))
+            else:
+                logger.error(f"File does not exist: {input_path}")
+                logger.error(f"Error processing {input_path}: File not found: {input_path}")
                 error_count += 1
 
+        if self.n_workers > 1:
+            # files are independent, so fan them out over a pool
+            # processes sidestep the gil for regex/contractions/spacy work, threads are enough when the function mostly waits on i/o
+            if self.executor == "process":
+                pool = ProcessPoolExecutor(max_workers=self.n_workers, initializer=_init_worker, initargs=(self.function,))
+            else:
+                pool = ThreadPoolExecutor(max_workers=self.n_workers, initializer=_init_worker, initargs=(self.function, True))
+
+            with pool as executor:
+                futures = {
+                    executor.submit(_apply_worker_function, input_path, output_path): input_path
+                    for input_path, output_path in jobs
+                }
+                for future in as_completed(futures): # log each file as soon as it's done, not in submission order
+                    input_path = futures[future]
+                    try:
+                        log_path = future.result()
+                        logger.info(f"File processed at destination: {log_path}")
+                        processed_count += 1
+                    except Exception as e:
+                        logger.error(f"Error processing {input_path}: {e}")
+                        error_count += 1
+
+        else:
+            function = self.function
+            for input_path, output_path in jobs:
+                try: 
+                    log_path = _apply_function(function, input_path, output_path)
+                    logger.info(f"File processed at destination: {log_path}")
+                    
+                    processed_count += 1
+
+                except Exception as e:
+                    logger.error(f"Error processing {input_path}: {e}")
+                    error_count += 1
+
         logger.info(f"Processing complete. Successfully processed {processed_count} files. Encountered {error_count} errors.")
         return self.output_file_path_list
     
@@ -0,0 +1,11 @@
+try:
+    import orjson # c json codec working on bytes
+except ImportError:
+    # same calls on the stdlib json: slower, but the same compact utf-8 output
+    import json
+    from types import SimpleNamespace
+    orjson = SimpleNamespace(
+        loads=json.loads,
+        dumps=lambda obj: json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+        JSONDecodeError=json.JSONDecodeError
+    )